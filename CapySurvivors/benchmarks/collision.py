@@ -0,0 +1,74 @@
+# benchmarks/collision.py
+"""
+Compares the bullet-vs-enemy collision pass done with
+pygame.sprite.spritecollide against the SpatialHash broad-phase.
+
+Run from the game root:
+    python -m benchmarks.collision
+"""
+import random
+import time
+
+import pygame
+
+from game.spatial import SpatialHash
+
+LEVEL_RECT = pygame.Rect(0, 0, 3400, 1500)
+SCENARIOS = [(100, 200), (500, 1000), (1000, 2000), (2000, 4000)]
+REPEATS = 5
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, rng, size):
+        super().__init__()
+        x = rng.randint(LEVEL_RECT.left, LEVEL_RECT.right - size[0])
+        y = rng.randint(LEVEL_RECT.top, LEVEL_RECT.bottom - size[1])
+        self.rect = pygame.Rect((x, y), size)
+
+
+def make_group(rng, count, size):
+    return pygame.sprite.Group(Box(rng, size) for _ in range(count))
+
+
+def brute_force(bullets, enemies):
+    hits = 0
+    for bullet in bullets:
+        hits += len(pygame.sprite.spritecollide(bullet, enemies, False))
+    return hits
+
+
+def with_grid(bullets, enemies, grid):
+    grid.build(enemies)
+    hits = 0
+    for bullet in bullets:
+        hits += len(grid.collide(bullet))
+    return hits
+
+
+def best_of(func, *args):
+    best = None
+    result = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    rng = random.Random(1234)
+    grid = SpatialHash(cell_size=128)
+    print(f"{'enemies':>8} {'bullets':>8} {'brute ms':>10} {'grid ms':>10} {'speedup':>8}")
+    for enemy_count, bullet_count in SCENARIOS:
+        enemies = make_group(rng, enemy_count, (60, 90))
+        bullets = make_group(rng, bullet_count, (10, 10))
+        brute_time, brute_hits = best_of(brute_force, bullets, enemies)
+        grid_time, grid_hits = best_of(with_grid, bullets, enemies, grid)
+        assert brute_hits == grid_hits, (brute_hits, grid_hits)
+        print(f"{enemy_count:>8} {bullet_count:>8} {brute_time * 1000:>10.2f} "
+              f"{grid_time * 1000:>10.2f} {brute_time / grid_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
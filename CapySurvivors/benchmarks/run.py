@@ -0,0 +1,156 @@
+# benchmarks/run.py
+"""
+Runs the canned scenarios from benchmarks/scenarios.py headlessly and
+reports update, collision and draw time per frame (p50/p95/p99).
+
+Run from the game root:
+    python -m benchmarks.run                       # all scenarios
+    python -m benchmarks.run horde_1000 bullet_storm --frames 600
+    python -m benchmarks.run --output new.json --compare old.json
+
+Results are written as JSON (commit, environment and per-scenario
+percentiles), so runs from different commits can be compared with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+
+import pygame
+
+from game import settings
+from game.headless import init_headless_display
+from game.profiler import profiler
+
+PHASES = ("update", "collision", "draw", "frame")
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples_ms):
+    values = sorted(samples_ms)
+    summary = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    summary["mean"] = sum(values) / len(values) if values else 0.0
+    summary["max"] = values[-1] if values else 0.0
+    return summary
+
+
+def current_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(factory, screen, sound_manager, frames, warmup):
+    scenario = factory(sound_manager)
+    session = scenario.session
+    dt = 1.0 / settings.SIM_RATE
+    samples = {phase: [] for phase in PHASES}
+    peak_counts = {}
+    for frame in range(warmup + frames):
+        scenario.before_frame(frame)
+        profiler.last.clear()
+        start = time.perf_counter()
+        session.step(dt, scenario.keys_pressed)
+        session.draw(screen)
+        elapsed = time.perf_counter() - start
+        if frame < warmup:
+            continue
+        for phase in ("update", "collision", "draw"):
+            samples[phase].append(profiler.last.get(phase, 0.0) * 1000.0)
+        samples["frame"].append(elapsed * 1000.0)
+        for name, count in scenario.entity_counts().items():
+            peak_counts[name] = max(peak_counts.get(name, 0), count)
+    session.stop_timers()
+    return {
+        "frames": frames,
+        "peak_counts": peak_counts,
+        "timings_ms": {phase: summarize(values) for phase, values in samples.items()},
+    }
+
+
+def print_results(results):
+    print(f"{'scenario':<14} {'phase':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, result in results["scenarios"].items():
+        for phase in PHASES:
+            timing = result["timings_ms"][phase]
+            print(f"{name:<14} {phase:<10} {timing['p50']:>8.2f} {timing['p95']:>8.2f} {timing['p99']:>8.2f}")
+
+
+def print_comparison(results, baseline):
+    """Prints the relative change of each frame-time percentile against a baseline run."""
+    print(f"\nvs. {baseline.get('commit') or 'baseline'} (frame time, + is slower)")
+    for name, result in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if old is None:
+            print(f"{name:<14} (not in baseline)")
+            continue
+        changes = []
+        for pct in PERCENTILES:
+            key = f"p{pct}"
+            before = old["timings_ms"]["frame"][key]
+            after = result["timings_ms"]["frame"][key]
+            change = (after - before) / before * 100.0 if before else 0.0
+            changes.append(f"{key} {before:.2f} -> {after:.2f} ms ({change:+.1f}%)")
+        print(f"{name:<14} " + ", ".join(changes))
+
+
+def main():
+    from benchmarks.scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description="Run the scenario benchmarks.")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario",
+                        help="scenarios to run (default: all): " + ", ".join(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=30, help="unmeasured frames before measuring")
+    parser.add_argument("--output", default=os.path.join(".cache", "bench_results.json"),
+                        help="where to write the JSON results (default: .cache/bench_results.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error("unknown scenario(s): " + ", ".join(unknown))
+
+    screen = init_headless_display()
+    from game.sounds import SoundManager
+    sound_manager = SoundManager(volume=0.0)
+
+    profiler_was_enabled = profiler.enabled
+    profiler.enabled = True
+    results = {
+        "commit": current_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "screen": [settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT],
+        "sim_rate": settings.SIM_RATE,
+        "scenarios": {},
+    }
+    for name in args.scenarios or SCENARIOS:
+        results["scenarios"][name] = run_scenario(SCENARIOS[name], screen, sound_manager,
+                                                  args.frames, args.warmup)
+    profiler.enabled = profiler_was_enabled
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print_results(results)
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        with open(args.compare, "r") as f:
+            print_comparison(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/scenarios.py
+"""
+Canned load scenarios for benchmarks/run.py.
+
+Each scenario builds a GameSession (Level, Player, enemy and bullet groups)
+and keeps its population at a fixed size between frames, so every measured
+frame sees the same load. The player is kept alive and the score at zero,
+so no scenario ends early or spawns the regular boss.
+"""
+import collections
+
+import pygame
+
+from game.bullet import LaserBullet
+from game.enemy import StandardEnemy, FastEnemy, TankyEnemy, HardBoss, Summon
+from game.rng import rng
+from game.session import GameSession
+
+
+class Scenario:
+    """
+    Base scenario: an empty session on the given difficulty.
+    Subclasses override setup() to populate it and replenish() to top it up
+    before every frame.
+    """
+    difficulty = "easy"
+
+    def __init__(self, name, sound_manager, seed=1234):
+        self.name = name
+        # Nobody is at the keyboard: the player stands still.
+        self.keys_pressed = collections.defaultdict(bool)
+        self.session = GameSession(self.difficulty, sound_manager, seed)
+        self.level_rect = pygame.Rect(0, 0, self.session.level.width, self.session.level.height)
+        self.setup()
+
+    def setup(self):
+        pass
+
+    def replenish(self):
+        pass
+
+    def before_frame(self, frame):
+        session = self.session
+        session.player.health = session.player.max_hp
+        session.score = 0
+        self.replenish()
+
+    def entity_counts(self):
+        session = self.session
+        return {
+            "enemies": len(session.enemy_group),
+            "bullets": len(session.bullet_group),
+            "boss_bullets": len(session.boss_bullet_group),
+        }
+
+
+class HordeScenario(Scenario):
+    """A horde of regular enemies chasing an idle player, topped up to a fixed count."""
+    def __init__(self, name, sound_manager, enemy_count, seed=1234):
+        self.enemy_count = enemy_count
+        super().__init__(name, sound_manager, seed)
+
+    def spawn_enemy(self):
+        session = self.session
+        speed = session.base_enemy_speed
+        roll = rng.random()
+        if roll < 0.50:
+            enemy = StandardEnemy.spawn(self.level_rect, session.player, speed=speed)
+        elif roll < 0.75:
+            enemy = FastEnemy.spawn(self.level_rect, session.player, speed=speed + 150)
+        else:
+            enemy = TankyEnemy.spawn(self.level_rect, session.player, speed=speed - 100)
+        session.enemy_group.add(enemy)
+
+    def setup(self):
+        self.replenish()
+
+    def replenish(self):
+        for _ in range(self.enemy_count - len(self.session.enemy_group)):
+            self.spawn_enemy()
+
+
+class BulletStormScenario(HordeScenario):
+    """
+    Shotgun plus laser bullet storm: the player has 8 bullets per shot,
+    fires a volley every few frames, a shotgun ring every frame and a laser
+    every 30 frames, into a horde of 300 enemies.
+    """
+    def __init__(self, name, sound_manager, seed=1234):
+        super().__init__(name, sound_manager, enemy_count=300, seed=seed)
+
+    def setup(self):
+        super().setup()
+        player = self.session.player
+        player.apply_boost("shotgun")
+        player.apply_boost("laser")
+        player.bullet_count = 8
+
+    def before_frame(self, frame):
+        super().before_frame(frame)
+        session = self.session
+        player = session.player
+        # Force a shotgun ring on every update.
+        player.shotgun_timer = 5
+        if frame % 4 == 0:
+            angle = frame * 7 % 360
+            target = player.pos + pygame.Vector2(400, 0).rotate(angle)
+            screen_pos = target - pygame.Vector2(session.camera.camera_rect.topleft)
+            session.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1,
+                                                    pos=(round(screen_pos.x), round(screen_pos.y))))
+        if frame % 30 == 0:
+            direction = pygame.Vector2(1, 0).rotate(frame % 360)
+            session.bullet_group.add(LaserBullet.create(player.pos, direction, player.bullet_speed))
+
+
+class SummonFloodScenario(Scenario):
+    """
+    A HardBoss next to the player, surrounded by a flood of Summons that is
+    topped up to summon_count; the boss keeps summoning and firing radial bursts.
+    """
+    difficulty = "hard"
+
+    def __init__(self, name, sound_manager, summon_count=1000, seed=1234):
+        self.summon_count = summon_count
+        super().__init__(name, sound_manager, seed)
+
+    def setup(self):
+        session = self.session
+        player_x, player_y = session.player.rect.center
+        session.boss = HardBoss((player_x + 600, player_y), session.player, session.boss_bullet_group,
+                                session.enemy_group, session.sound_manager)
+        session.enemy_group.add(session.boss)
+        self.replenish()
+
+    def before_frame(self, frame):
+        super().before_frame(frame)
+        boss = self.session.boss
+        # Keep the boss alive and summoning every frame.
+        boss.health = 250
+        boss.summon_timer = 2.0
+
+    def replenish(self):
+        session = self.session
+        boss = session.boss
+        for _ in range(self.summon_count + 1 - len(session.enemy_group)):
+            summon_pos = (boss.pos.x + rng.randint(-400, 400), boss.pos.y + rng.randint(-400, 400))
+            session.enemy_group.add(Summon(summon_pos, session.player, speed=250, health=1))
+
+
+# name: factory(sound_manager) -> Scenario
+SCENARIOS = {
+    "horde_200": lambda sound_manager: HordeScenario("horde_200", sound_manager, 200),
+    "horde_1000": lambda sound_manager: HordeScenario("horde_1000", sound_manager, 1000),
+    "horde_5000": lambda sound_manager: HordeScenario("horde_5000", sound_manager, 5000),
+    "bullet_storm": lambda sound_manager: BulletStormScenario("bullet_storm", sound_manager),
+    "summon_flood": lambda sound_manager: SummonFloodScenario("summon_flood", sound_manager),
+}
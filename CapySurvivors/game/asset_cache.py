@@ -0,0 +1,178 @@
+# game/asset_cache.py
+"""
+On-disk cache of decoded, scaled image pixels and decoded sound samples.
+
+Decoding a PNG and resampling it (the level backgrounds are scaled to the
+whole level) costs far more than reading the raw pixels back, so the first
+load of each (source, target size, pixel format) writes them to
+settings.ASSET_CACHE_DIR. Later loads memory-map the file and hand pygame
+the pixels without decoding or scaling anything.
+
+A cache file starts with a fixed header recording the source file's mtime
+and size; if the source has changed since, the entry is rebuilt. Files are
+written to a temporary name and renamed, so concurrent loaders (see
+game.preload) never read a partial entry. Any cache error falls back to
+decoding the source.
+
+Sounds are kept the same way as raw PCM in the mixer's sample format
+(settings.AUDIO_CACHE), which loads without running the MP3 decoder.
+
+    python -m game.asset_cache          # list the cache
+    python -m game.asset_cache --clear  # delete it
+"""
+import mmap
+import os
+import re
+import struct
+import sys
+
+import pygame
+from game import settings
+
+CACHE_VERSION = 1
+# magic, version, bytes per pixel, width, height, source mtime (ns), source size.
+HEADER = struct.Struct("<4sHHIIqq")
+MAGIC = b"CAPY"
+FORMATS = {3: "RGB", 4: "RGBA"}
+# magic, version, mixer frequency, sample format, channels, source mtime (ns), source size.
+SOUND_HEADER = struct.Struct("<4sHihhqq")
+SOUND_MAGIC = b"CAPS"
+
+
+def _entry_name(path):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.normpath(path))
+
+
+def cache_path(path, size, alpha):
+    """The cache file of one load_image key."""
+    size_tag = f"{size[0]}x{size[1]}" if size is not None else "native"
+    return os.path.join(settings.ASSET_CACHE_DIR, f"{_entry_name(path)}-{size_tag}-{'rgba' if alpha else 'rgb'}.raw")
+
+
+def sound_cache_path(path, mixer_format):
+    """The cache file of one sound for the mixer format (frequency, sample format, channels)."""
+    frequency, sample_format, channels = mixer_format
+    return os.path.join(settings.ASSET_CACHE_DIR,
+                        f"{_entry_name(path)}-{frequency}-{sample_format}-{channels}.pcm")
+
+
+def _write_entry(target, header, data):
+    """Writes header + data to target through a temporary file; errors are reported, not raised."""
+    temp = f"{target}.{os.getpid()}.{id(data)}.tmp"
+    try:
+        os.makedirs(settings.ASSET_CACHE_DIR, exist_ok=True)
+        with open(temp, "wb") as f:
+            f.write(header)
+            f.write(data)
+        os.replace(temp, target)
+    except OSError as e:
+        print("Error writing asset cache:", e)
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+
+
+def read(path, size, alpha):
+    """
+    Returns the cached, already scaled surface for the source path, or None
+    if there is no valid entry. The surface shares the mapped file's memory,
+    so callers must convert (copy) it before keeping it.
+    """
+    try:
+        source = os.stat(path)
+        with open(cache_path(path, size, alpha), "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(data) < HEADER.size:
+        return None
+    magic, version, depth, width, height, mtime, length = HEADER.unpack_from(data)
+    if (magic != MAGIC or version != CACHE_VERSION or depth != (4 if alpha else 3)
+            or mtime != source.st_mtime_ns or length != source.st_size
+            or len(data) != HEADER.size + width * height * depth):
+        return None
+    pixels = memoryview(data)[HEADER.size:]
+    return pygame.image.frombuffer(pixels, (width, height), FORMATS[depth])
+
+
+def write(path, size, alpha, image):
+    """Stores the decoded, scaled image for the source path."""
+    try:
+        source = os.stat(path)
+    except OSError:
+        return
+    depth = 4 if alpha else 3
+    header = HEADER.pack(MAGIC, CACHE_VERSION, depth, image.get_width(), image.get_height(),
+                         source.st_mtime_ns, source.st_size)
+    _write_entry(cache_path(path, size, alpha), header, pygame.image.tobytes(image, FORMATS[depth]))
+
+
+def read_sound(path):
+    """
+    Returns a pygame.mixer.Sound built from the cached samples of the source
+    path, or None if there is no valid entry for the current mixer format.
+    """
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        return None
+    try:
+        source = os.stat(path)
+        with open(sound_cache_path(path, mixer_format), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < SOUND_HEADER.size:
+        return None
+    magic, version, frequency, sample_format, channels, mtime, length = SOUND_HEADER.unpack_from(data)
+    if (magic != SOUND_MAGIC or version != CACHE_VERSION
+            or (frequency, sample_format, channels) != mixer_format
+            or mtime != source.st_mtime_ns or length != source.st_size):
+        return None
+    return pygame.mixer.Sound(buffer=data[SOUND_HEADER.size:])
+
+
+def write_sound(path, sound):
+    """Stores the decoded samples of the source path's sound."""
+    mixer_format = pygame.mixer.get_init()
+    try:
+        source = os.stat(path)
+    except OSError:
+        return
+    if not mixer_format:
+        return
+    header = SOUND_HEADER.pack(SOUND_MAGIC, CACHE_VERSION, *mixer_format, source.st_mtime_ns, source.st_size)
+    _write_entry(sound_cache_path(path, mixer_format), header, sound.get_raw())
+
+
+def clear():
+    """Deletes every cache file; returns how many there were."""
+    removed = 0
+    if os.path.isdir(settings.ASSET_CACHE_DIR):
+        for name in os.listdir(settings.ASSET_CACHE_DIR):
+            if name.endswith((".raw", ".pcm")):
+                os.remove(os.path.join(settings.ASSET_CACHE_DIR, name))
+                removed += 1
+    return removed
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--clear" in argv:
+        print(f"Removed {clear()} cached assets from {settings.ASSET_CACHE_DIR}")
+        return 0
+    if not os.path.isdir(settings.ASSET_CACHE_DIR):
+        print(f"{settings.ASSET_CACHE_DIR} is empty")
+        return 0
+    total = 0
+    for name in sorted(os.listdir(settings.ASSET_CACHE_DIR)):
+        if name.endswith((".raw", ".pcm")):
+            size = os.path.getsize(os.path.join(settings.ASSET_CACHE_DIR, name))
+            total += size
+            print(f"{size / 1024:10.0f} KiB  {name}")
+    print(f"{total / 1024 / 1024:10.1f} MiB  total")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
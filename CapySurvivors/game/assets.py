@@ -0,0 +1,153 @@
+# game/assets.py
+import collections
+import pygame
+from game import asset_cache, settings
+
+# Process-wide cache of converted (and optionally scaled) images,
+# keyed by (path, size, alpha). Surfaces handed out are shared, so callers
+# must treat them as read-only.
+_image_cache = {}
+
+# Decoded sounds by path; pygame.mixer.Sound objects need no display, so
+# they can be decoded on a worker thread (see game.preload).
+_sound_cache = {}
+
+# Fonts by (name, size), and rendered text by (font, text, color, antialias).
+# Text changes (scores, animated dialog), so that cache is bounded and
+# evicts the least recently used surface.
+TEXT_CACHE_SIZE = 512
+_font_cache = {}
+_text_cache = collections.OrderedDict()
+
+# Translucent fills by (size, color), for the screen size they were built at.
+_overlay_cache = {}
+_overlay_screen_size = None
+
+
+def load_image(path, size=None, alpha=True):
+    """
+    Loads an image from disk once and returns the shared surface.
+      - path: file path relative to the game root (e.g. "assets/images/coin.png").
+      - size: optional (width, height) to scale the image to.
+      - alpha: convert with per-pixel alpha (True) or as an opaque surface (False).
+    Raises the same errors as pygame.image.load if the file cannot be read,
+    so callers can keep their own placeholder fallbacks.
+    """
+    key = (path, tuple(size) if size is not None else None, alpha)
+    image = _image_cache.get(key)
+    if image is None:
+        image = add_image(path, decode_image(path, size, alpha), size, alpha)
+    return image
+
+
+def decode_image(path, size=None, alpha=True):
+    """
+    The thread-safe half of load_image: reads, decodes and scales the file
+    without touching the display. Pass the result to add_image on the main thread.
+    With settings.ASSET_CACHE the scaled pixels come from (or are saved to)
+    the on-disk cache in game.asset_cache instead.
+    """
+    if settings.ASSET_CACHE:
+        image = asset_cache.read(path, size, alpha)
+        if image is not None:
+            return image
+    image = pygame.image.load(path)
+    if size is not None:
+        image = pygame.transform.scale(image, tuple(size))
+    if settings.ASSET_CACHE:
+        asset_cache.write(path, size, alpha, image)
+    return image
+
+
+def add_image(path, image, size=None, alpha=True):
+    """
+    The main-thread half of load_image: converts a decode_image result to the
+    display format and caches it under the key load_image(path, size, alpha) uses.
+    """
+    image = image.convert_alpha() if alpha else image.convert()
+    _image_cache[(path, tuple(size) if size is not None else None, alpha)] = image
+    return image
+
+
+def is_image_loaded(path, size=None, alpha=True):
+    return (path, tuple(size) if size is not None else None, alpha) in _image_cache
+
+
+def load_sound(path):
+    """
+    Decodes a sound file once and returns the shared pygame.mixer.Sound.
+    The mixer must be initialised. Safe to call from worker threads.
+    With settings.AUDIO_CACHE the decoded samples come from (or are saved to)
+    the on-disk cache in game.asset_cache.
+    """
+    sound = _sound_cache.get(path)
+    if sound is None:
+        if settings.AUDIO_CACHE:
+            sound = asset_cache.read_sound(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            if settings.AUDIO_CACHE:
+                asset_cache.write_sound(path, sound)
+        _sound_cache[path] = sound
+    return sound
+
+
+def load_animation(directory, image_count, size, suffix=""):
+    """
+    Loads a left/right walking animation from
+    <directory>/left_<i><suffix>.png and <directory>/right_<i><suffix>.png.
+    Returns a new {"left": [...], "right": [...]} dict whose frames are shared.
+    """
+    animations = {"left": [], "right": []}
+    for direction in ("left", "right"):
+        for i in range(1, image_count + 1):
+            path = f"{directory}/{direction}_{i}{suffix}.png"
+            animations[direction].append(load_image(path, size))
+    return animations
+
+
+def load_font(name, size):
+    """Returns the shared pygame.font.Font for (name, size); name None is pygame's default font."""
+    key = (name, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _font_cache[key] = font
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    font.render(text, antialias, color), cached: returns the shared surface
+    rendered the last time the same text was asked for. Read-only, like images.
+    """
+    key = (font, text, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def overlay_surface(color, size=None):
+    """
+    Shared per-pixel-alpha surface of size (the screen size if None) filled
+    with the RGBA color, for tints, dimming and menu panels. Built once and
+    reused; every overlay is rebuilt after settings.SCREEN_WIDTH/HEIGHT change.
+    """
+    global _overlay_screen_size
+    screen_size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    if screen_size != _overlay_screen_size:
+        _overlay_cache.clear()
+        _overlay_screen_size = screen_size
+    key = (tuple(size) if size is not None else screen_size, tuple(color))
+    surface = _overlay_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface(key[0], pygame.SRCALPHA)
+        surface.fill(key[1])
+        _overlay_cache[key] = surface
+    return surface
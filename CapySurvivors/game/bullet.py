@@ -1,75 +1,217 @@
 # game/bullet.py
 import pygame
 from game import settings
+from game.soa import ArrayField, ArrayGroup, np
 
-class Bullet(pygame.sprite.Sprite):
+# Owner codes stored per projectile.
+OWNER_PLAYER = 0
+OWNER_BOSS = 1
+
+
+class Projectile(pygame.sprite.Sprite):
     """
-    A bullet fired by the player.
-    (Collision with walls/obstacles is handled externally in the main loop.)
+    Base class for everything that flies in a straight line.
+      - All projectiles of one kind share a single pre-rendered image.
+      - Killed projectiles go back to a per-kind pool and are reused by create(),
+        so bullet-heavy fights do not allocate new sprites or surfaces.
+      - Inside a ProjectileGroup, position, direction, speed, remaining
+        lifetime and owner live in the group's arrays and are integrated in one batch.
+      - Projectiles die when their lifetime (max_lifetime seconds by default)
+        runs out; see cull_projectiles() for walls and level bounds.
+    Subclasses set radius, color, owner and max_lifetime.
     """
-    def __init__(self, pos, direction, speed):
+    radius = 5
+    color = (0, 0, 0)
+    owner = OWNER_PLAYER
+    max_lifetime = 6.0
+    array_group = None
+    slot = -1
+
+    pos = ArrayField()
+    direction = ArrayField()
+    speed = ArrayField()
+    lifetime = ArrayField()
+
+    _images = {}
+    _pool = []
+
+    def __init__(self, pos, direction, speed, lifetime=None):
         super().__init__()
+        self.image = self.shared_image()
+        self.rect = self.image.get_rect()
+        self.reset(pos, direction, speed, lifetime)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    @classmethod
+    def shared_image(cls):
+        image = Projectile._images.get(cls)
+        if image is None:
+            image = pygame.Surface((cls.radius * 2, cls.radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, cls.color, (cls.radius, cls.radius), cls.radius)
+            Projectile._images[cls] = image
+        return image
+
+    @classmethod
+    def create(cls, pos, direction, speed, *args, **kwargs):
+        """Returns a projectile from the pool (or a new one) set up with the given state."""
+        if cls._pool:
+            projectile = cls._pool.pop()
+            projectile.reset(pos, direction, speed, *args, **kwargs)
+            return projectile
+        return cls(pos, direction, speed, *args, **kwargs)
+
+    def reset(self, pos, direction, speed, lifetime=None):
         self.speed = speed
         self.direction = pygame.Vector2(direction)
-        radius = 5
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (0, 0, 0), (radius, radius), radius)
-        self.rect = self.image.get_rect(center=pos)
+        self.lifetime = self.max_lifetime if lifetime is None else lifetime
+        self.rect.center = pos
         self.pos = pygame.Vector2(pos)
+        # A recycled projectile must not be interpolated from its previous life.
+        self.__dict__.pop("prev_center", None)
+
+    def kill(self):
+        # Only recycle projectiles that were still alive, so a double kill
+        # cannot put the same object into the pool twice.
+        if self.alive():
+            super().kill()
+            type(self)._pool.append(self)
 
     def update(self, dt):
         displacement = self.direction * self.speed * dt
         self.pos += displacement
         self.rect.center = (round(self.pos.x), round(self.pos.y))
-        
+        self.lifetime -= dt
+        if self.lifetime <= 0:
+            self.kill()
+
 
-class BossBullet(pygame.sprite.Sprite):
+class Bullet(Projectile):
+    """
+    A bullet fired by the player.
+    (Collision with walls/obstacles is handled externally in the main loop.)
+    """
+    radius = 5
+    color = (0, 0, 0)
+
+
+class BossBullet(Projectile):
     """
     A bullet fired by the boss.
     Deals 10 damage to the player upon collision.
     """
-    def __init__(self, pos, direction, speed):
-        super().__init__()
-        self.speed = speed
-        self.direction = pygame.Vector2(direction)
-        radius = 7  # slightly larger than player bullet
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        # Draw the bullet in red
-        pygame.draw.circle(self.image, (255, 0, 0), (radius, radius), radius)
-        self.rect = self.image.get_rect(center=pos)
-        self.pos = pygame.Vector2(pos)
+    radius = 7  # slightly larger than player bullet
+    color = (255, 0, 0)
+    owner = OWNER_BOSS
+    max_lifetime = 5.0
 
-    def update(self, dt):
-        displacement = self.direction * self.speed * dt
-        self.pos += displacement
-        self.rect.center = (round(self.pos.x), round(self.pos.y))
 
-class LaserBullet(pygame.sprite.Sprite):
+class LaserBullet(Projectile):
     """
     A laser bullet fired automatically by the player when the laser powerup is active.
-    It is drawn as a long, red rectangle, pierces through enemies (does not self-destruct on collision),
+    It is drawn as a red circle, pierces through enemies (does not self-destruct on collision),
     and disappears after a short duration.
     """
-    def __init__(self, pos, direction, speed, duration=3.0):
-        super().__init__()
-        self.speed = speed
+    radius = 10
+    color = (255, 0, 0)
+    is_laser = True
+    max_lifetime = 3.0
+
+    def __init__(self, pos, direction, speed, duration=None):
+        super().__init__(pos, direction, speed, duration)
+
+    def reset(self, pos, direction, speed, duration=None):
+        super().reset(pos, direction, speed, lifetime=duration)
         self.direction = pygame.Vector2(direction).normalize()
-        self.duration = duration  # lifetime in seconds
-        self.is_laser = True 
         self.damaged_enemies = set()
 
-        # Create a simple circle bullet.
-        radius = 10  # adjust radius as desired
-        diameter = 2 * radius
-        self.image = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 0, 0), (radius, radius), radius)
-        self.rect = self.image.get_rect(center=pos)
-        self.pos = pygame.Vector2(pos)
+    @property
+    def duration(self):
+        return self.lifetime
 
-    def update(self, dt):
-        displacement = self.direction * self.speed * dt
-        self.pos += displacement
-        self.rect.center = (round(self.pos.x), round(self.pos.y))
-        self.duration -= dt
-        if self.duration <= 0:
-            self
\ No newline at end of file
+
+class ProjectileGroup(ArrayGroup):
+    """
+    Sprite group that integrates all its projectiles in one NumPy step:
+    moves them, counts down their lifetimes and kills (recycles) the
+    expired ones, then syncs the sprites' rects.
+    """
+    FIELDS = {
+        "pos": ("float64", (2,)),
+        "direction": ("float64", (2,)),
+        "speed": ("float64", ()),
+        "lifetime": ("float64", ()),
+        "owner": ("int64", ()),
+        "radius": ("int64", ()),
+    }
+    INTERNAL_FIELDS = ("owner", "radius")
+
+    def accepts(self, sprite):
+        return isinstance(sprite, Projectile)
+
+    def attach(self, sprite, slot):
+        self.arrays["owner"][slot] = sprite.owner
+        self.arrays["radius"][slot] = sprite.radius
+
+    def step(self, dt):
+        count = len(self.members)
+        if count == 0:
+            return
+        arrays = self.arrays
+        arrays["pos"][:count] += arrays["direction"][:count] * (arrays["speed"][:count] * dt)[:, None]
+        lifetime = arrays["lifetime"][:count]
+        lifetime -= dt
+        self.sync_rects(count)
+
+        expired = np.flatnonzero(lifetime <= 0).tolist()
+        if expired:
+            for projectile in [self.members[slot] for slot in expired]:
+                projectile.kill()
+
+    def cull(self, level):
+        """Kills every projectile that left the level or overlaps a wall/obstacle tile."""
+        count = len(self.members)
+        if count == 0:
+            return
+        centers = np.rint(self.arrays["pos"][:count]).astype(np.int64)
+        radius = self.arrays["radius"][:count]
+        left = centers[:, 0] - radius
+        top = centers[:, 1] - radius
+        right = centers[:, 0] + radius - 1
+        bottom = centers[:, 1] + radius - 1
+        dead = (right < 0) | (bottom < 0) | (left >= level.width) | (top >= level.height)
+
+        # A projectile is never larger than a tile, so testing the cells under
+        # its four corners covers every tile its rect can overlap.
+        solid = np.frombuffer(level.solid, dtype=np.uint8).reshape(level.rows, level.cols)
+        size = level.tile_size
+        for x, y in ((left, top), (right, top), (left, bottom), (right, bottom)):
+            col = x // size
+            row = y // size
+            inside = (col >= 0) & (col < level.cols) & (row >= 0) & (row < level.rows)
+            dead |= inside & (solid[row.clip(0, level.rows - 1), col.clip(0, level.cols - 1)] == 1)
+
+        culled = np.flatnonzero(dead).tolist()
+        if culled:
+            for projectile in [self.members[slot] for slot in culled]:
+                projectile.kill()
+
+
+def cull_projectiles(group, level):
+    """Kills the projectiles of group that left the level bounds or hit a wall/obstacle."""
+    if isinstance(group, ProjectileGroup):
+        group.cull(level)
+        return
+    level_rect = pygame.Rect(0, 0, level.width, level.height)
+    for projectile in group.sprites():
+        if not level_rect.colliderect(projectile.rect) or level.rect_blocked(projectile.rect):
+            projectile.kill()
+
+
+def make_projectile_group():
+    """Returns a ProjectileGroup when NumPy is available, else a plain Group."""
+    if np is not None:
+        return ProjectileGroup()
+    return pygame.sprite.Group()
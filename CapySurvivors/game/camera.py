@@ -1,4 +1,5 @@
 # game/camera.py
+import copy
 import pygame
 from game import settings
 
@@ -7,6 +8,7 @@ class Camera:
         self.level_width = level_width
         self.level_height = level_height
         self.camera_rect = pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        self.prev_topleft = self.camera_rect.topleft
         print(f"Camera initialized with level_width: {level_width}, level_height: {level_height}")
 
     def apply(self, target):
@@ -22,3 +24,16 @@ class Camera:
         x = max(0, min(x, self.level_width - settings.SCREEN_WIDTH))
         y = max(0, min(y, self.level_height - settings.SCREEN_HEIGHT))
         self.camera_rect.topleft = (x, y)
+
+    def snapshot(self):
+        """Remembers the current position as the previous tick's, for interpolation."""
+        self.prev_topleft = self.camera_rect.topleft
+
+    def interpolated(self, alpha):
+        """Returns a copy of the camera placed at fraction alpha between the previous tick and now."""
+        view = copy.copy(self)
+        view.camera_rect = self.camera_rect.copy()
+        prev_x, prev_y = self.prev_topleft
+        view.camera_rect.topleft = (round(prev_x + (self.camera_rect.x - prev_x) * alpha),
+                                    round(prev_y + (self.camera_rect.y - prev_y) * alpha))
+        return view
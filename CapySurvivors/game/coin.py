@@ -1,5 +1,6 @@
 import pygame
 from game import settings
+from game.assets import load_image
 
 class Coin(pygame.sprite.Sprite):
     """
@@ -12,8 +13,7 @@ class Coin(pygame.sprite.Sprite):
 
         # Load the coin image from assets/images
         try:
-            self.image = pygame.image.load("assets/images/coin.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (40, 40))  # Scale if needed
+            self.image = load_image("assets/images/coin.png", (40, 40))  # Scale if needed
         except Exception as e:
             print("Error loading coin image:", e)
             # Fallback in case of missing image
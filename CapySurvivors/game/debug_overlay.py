@@ -0,0 +1,113 @@
+# game/debug_overlay.py
+import collections
+import pygame
+from game import settings
+from game.assets import overlay_surface
+
+# Phases shown in the breakdown, in frame order: (profiler scope, label).
+PHASES = (
+    ("events", "events"),
+    ("update.player", "update: player"),
+    ("update.enemies", "update: enemies"),
+    ("update.bullets", "update: bullets"),
+    ("collision", "collision"),
+    ("draw.level", "Level.draw"),
+    ("draw.entities", "entity blits"),
+    ("draw.ui", "UI.draw_status"),
+    ("flip", "display.flip"),
+)
+
+PANEL_WIDTH = 360
+GRAPH_HEIGHT = 80
+LINE_HEIGHT = 18
+# Frame time at the top of the graph, in milliseconds.
+GRAPH_MAX_MS = 50.0
+# Seconds between text refreshes; the graph is redrawn every frame.
+TEXT_INTERVAL = 0.25
+
+
+class ProfilerOverlay:
+    """
+    Toggleable debug panel (settings.PROFILER_KEY) drawn over the game:
+      - a rolling graph of the last `history` frame times, with 60 and 30 FPS lines,
+      - the time spent per phase in the last frame, read from the profiler scopes,
+      - live counts per sprite group (drawn/total when visible counts are given).
+    The profiler is only enabled while the overlay is shown.
+    """
+    def __init__(self, profiler, history=180):
+        self.profiler = profiler
+        # Stays open across runs: the profiler is left enabled while it is shown.
+        self.visible = profiler.enabled
+        self.frame_times = collections.deque(maxlen=history)
+        self.font = pygame.font.Font(None, 22)
+        self.text_surface = None
+        self.text_timer = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.profiler.enabled = self.visible
+        self.profiler.end_frame()
+        self.frame_times.clear()
+        self.text_surface = None
+
+    def handle_event(self, event):
+        """Returns True if the event was the toggle key."""
+        if event.type == pygame.KEYDOWN and event.key == settings.PROFILER_KEY:
+            self.toggle()
+            return True
+        return False
+
+    def end_frame(self, frame_dt, counts, visible_counts=None):
+        """Collects the profiler scopes of the frame that just finished."""
+        phases = self.profiler.end_frame()
+        if not self.visible:
+            return
+        self.frame_times.append(frame_dt * 1000.0)
+        self.text_timer -= frame_dt
+        if self.text_surface is None or self.text_timer <= 0:
+            self.text_timer = TEXT_INTERVAL
+            self.text_surface = self._render_text(phases, counts, visible_counts)
+
+    def _render_text(self, phases, counts, visible_counts):
+        # (label, value) rows; values are right-aligned in their own column.
+        rows = []
+        if self.frame_times:
+            recent = self.frame_times[-1]
+            rows.append((f"frame ({1000.0 / recent:.0f} FPS)" if recent else "frame", f"{recent:.1f} ms"))
+            rows.append(("worst frame", f"{max(self.frame_times):.1f} ms"))
+        for scope_name, label in PHASES:
+            rows.append((label, f"{phases.get(scope_name, 0.0) * 1000.0:.2f} ms"))
+        for name, count in counts.items():
+            if visible_counts is None:
+                rows.append((name, str(count)))
+            else:
+                rows.append((f"{name} (drawn)", f"{visible_counts.get(name, 0)}/{count}"))
+
+        surface = pygame.Surface((PANEL_WIDTH, LINE_HEIGHT * len(rows)), pygame.SRCALPHA)
+        for i, (label, value) in enumerate(rows):
+            y = i * LINE_HEIGHT
+            surface.blit(self.font.render(label, True, settings.WHITE), (0, y))
+            value_surface = self.font.render(value, True, settings.WHITE)
+            surface.blit(value_surface, value_surface.get_rect(topright=(PANEL_WIDTH, y)))
+        return surface
+
+    def draw(self, screen):
+        if not self.visible:
+            return
+        text_height = self.text_surface.get_height() if self.text_surface else 0
+        panel = pygame.Rect(10, 90, PANEL_WIDTH + 20, GRAPH_HEIGHT + text_height + 30)
+        screen.blit(overlay_surface((0, 0, 0, 170), panel.size), panel.topleft)
+
+        graph = pygame.Rect(panel.x + 10, panel.y + 10, PANEL_WIDTH, GRAPH_HEIGHT)
+        for target_ms, color in ((1000.0 / 60, settings.GREEN), (1000.0 / 30, settings.RED)):
+            y = graph.bottom - int(target_ms / GRAPH_MAX_MS * GRAPH_HEIGHT)
+            pygame.draw.line(screen, color, (graph.left, y), (graph.right, y))
+        if len(self.frame_times) > 1:
+            step = PANEL_WIDTH / (self.frame_times.maxlen - 1)
+            points = [(graph.left + i * step,
+                       graph.bottom - min(ms, GRAPH_MAX_MS) / GRAPH_MAX_MS * GRAPH_HEIGHT)
+                      for i, ms in enumerate(self.frame_times)]
+            pygame.draw.lines(screen, settings.WHITE, False, points)
+
+        if self.text_surface is not None:
+            screen.blit(self.text_surface, (graph.left, graph.bottom + 10))
@@ -1,5 +1,9 @@
 import pygame
 from game import settings
+from game.assets import load_font, load_image, overlay_surface, render_text
+
+CHARACTER_IMAGE = "assets/images/character_dialog.png"
+CHARACTER_SIZE = (550, 650)
 
 def run_dialog_scene(screen, background):
     """
@@ -27,9 +31,8 @@ def run_dialog_scene(screen, background):
 
     # --- Load the character sprite ---
     try:
-        character_sprite = pygame.image.load("assets/images/character_dialog.png").convert_alpha()
-        SPRITE_WIDTH, SPRITE_HEIGHT = 550, 650 
-        character_sprite = pygame.transform.scale(character_sprite, (SPRITE_WIDTH, SPRITE_HEIGHT))
+        SPRITE_WIDTH, SPRITE_HEIGHT = CHARACTER_SIZE
+        character_sprite = load_image(CHARACTER_IMAGE, CHARACTER_SIZE)
     except Exception as e:
         print("Error loading character sprite for dialogue:", e)
         SPRITE_WIDTH, SPRITE_HEIGHT = 400, 600
@@ -39,12 +42,13 @@ def run_dialog_scene(screen, background):
     # --- Calculate positions ---
     # Dialog box rectangle.
     dialog_box_rect = pygame.Rect(BOX_X, BOX_Y, BOX_WIDTH, BOX_HEIGHT)
+    dialog_box_surface = overlay_surface((0, 0, 0, 180), dialog_box_rect.size)
     # The character sprite appears above the dialog box at the right side.
     sprite_x = settings.SCREEN_WIDTH - SPRITE_WIDTH - 10
     sprite_y = dialog_box_rect.top - SPRITE_HEIGHT 
 
     # --- Font setup for text ---
-    font = pygame.font.Font(None, 72)
+    font = load_font(None, 72)
 
     # --- Variables for letter-by-letter animation ---
     current_message_index = 0
@@ -92,13 +96,11 @@ def run_dialog_scene(screen, background):
                                 screen.blit(background, (0, 0))
                                 # Compute the new position for the dialog box.
                                 new_box_rect = pygame.Rect(BOX_X, BOX_Y + slide_offset, BOX_WIDTH, BOX_HEIGHT)
-                                dialog_box_surface = pygame.Surface((new_box_rect.width, new_box_rect.height), pygame.SRCALPHA)
-                                dialog_box_surface.fill((0, 0, 0, 180))
                                 screen.blit(dialog_box_surface, (new_box_rect.x, new_box_rect.y))
                                 # Draw the (final) text.
                                 lines = displayed_text.split('\n')
                                 for i, line in enumerate(lines):
-                                    text_surface = font.render(line, True, settings.WHITE)
+                                    text_surface = render_text(font, line, settings.WHITE)
                                     text_x = new_box_rect.x + 20
                                     text_y = new_box_rect.y + 20 + i * text_surface.get_height()
                                     screen.blit(text_surface, (text_x, text_y))
@@ -128,12 +130,16 @@ def run_dialog_scene(screen, background):
 
         # --- Draw the dialog scene ---
         screen.blit(background, (0, 0))
-        dialog_box_surface = pygame.Surface((dialog_box_rect.width, dialog_box_rect.height), pygame.SRCALPHA)
-        dialog_box_surface.fill((0, 0, 0, 180))
         screen.blit(dialog_box_surface, (dialog_box_rect.x, dialog_box_rect.y))
         lines = displayed_text.split('\n')
+        animating = letter_index < len(current_full_text)
         for i, line in enumerate(lines):
-            text_surface = font.render(line, True, settings.WHITE)
+            if animating and i == len(lines) - 1:
+                # The line being typed is a new prefix every few frames: render
+                # it directly so it does not push other text out of the cache.
+                text_surface = font.render(line, True, settings.WHITE)
+            else:
+                text_surface = render_text(font, line, settings.WHITE)
             text_x = dialog_box_rect.x + 20
             text_y = dialog_box_rect.y + 20 + i * text_surface.get_height()
             screen.blit(text_surface, (text_x, text_y))
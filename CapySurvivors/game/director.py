@@ -0,0 +1,138 @@
+# game/director.py
+import bisect
+
+from game import settings
+
+# What the director spawns, in the order spawns due at the same time come out.
+SPAWN_KINDS = ("enemy", "item", "coin")
+# Kinds whose pace the frame-time throttle slows down.
+THROTTLED_KINDS = ("enemy",)
+
+
+def interval_at(curve, elapsed):
+    """
+    Seconds between spawns elapsed seconds into the run, from a wave curve:
+    (seconds into the run, interval) points in time order, linear in between,
+    flat before the first point and after the last.
+    """
+    times = [point[0] for point in curve]
+    index = bisect.bisect_right(times, elapsed)
+    if index == 0:
+        return curve[0][1]
+    if index == len(curve):
+        return curve[-1][1]
+    (start, start_interval), (end, end_interval) = curve[index - 1], curve[index]
+    return start_interval + (end_interval - start_interval) * (elapsed - start) / (end - start)
+
+
+class SpawnDirector:
+    """
+    Decides when enemies, items and coins spawn; the session creates them.
+      - start() starts the run clock, stop() stops it.
+      - advance(dt, live) moves the run clock forward by one tick and returns
+        the kinds (SPAWN_KINDS) that spawn this tick, in the order they came
+        due. live is the number of live enemies, items and coins.
+    Pacing follows the difficulty's wave curves (settings.SPAWN_WAVES; see
+    interval_at). While live has reached settings.SPAWN_ENTITY_CAP, spawns
+    that come due are skipped, not saved up. Bosses and summons are not
+    spawned by the director and are not held back by the cap.
+
+    With settings.SPAWN_THROTTLE, record_frame(work, frame_dt) is given the
+    simulation and render time of every rendered frame. Once a window of
+    settings.SPAWN_THROTTLE_WINDOW seconds uses more than SPAWN_THROTTLE_HIGH
+    of the frame budget (1 / settings.FPS) on average, rate, the fraction
+    of the curve's pace enemies spawn at, drops one SPAWN_THROTTLE_STEP (down
+    to SPAWN_THROTTLE_MIN_RATE); below SPAWN_THROTTLE_LOW it climbs back.
+    Every change is printed and counted in stats.
+    The rate is the only thing in a run that depends on the machine, so
+    replays record it (see game.replay).
+    """
+    def __init__(self, difficulty):
+        self.waves = settings.SPAWN_WAVES.get(difficulty, settings.SPAWN_WAVES["easy"])
+        self.elapsed = 0.0
+        self.running = False
+        # Run time each kind spawns next.
+        self.due = {}
+        self.rate = 1.0
+        self.window_work = 0.0
+        self.window_frames = 0
+        self.window_time = 0.0
+        self.stats = {"spawned": dict.fromkeys(SPAWN_KINDS, 0), "capped": 0,
+                      "throttle_changes": 0, "throttled_seconds": 0.0, "min_rate": 1.0}
+
+    def interval(self, kind):
+        """Current seconds between spawns of kind, slowed down by the throttle."""
+        interval = interval_at(self.waves[kind], self.elapsed)
+        if kind in THROTTLED_KINDS:
+            interval /= self.rate
+        return interval
+
+    def start(self):
+        for kind in SPAWN_KINDS:
+            self.due[kind] = self.elapsed + self.interval(kind)
+        self.running = True
+
+    def stop(self):
+        self.running = False
+        self.due.clear()
+
+    def advance(self, dt, live):
+        if not self.running:
+            return []
+        self.elapsed += dt
+        if self.rate < 1.0:
+            self.stats["throttled_seconds"] += dt
+        fired = []
+        for kind in SPAWN_KINDS:
+            while self.elapsed >= self.due[kind]:
+                fired.append((self.due[kind], kind))
+                self.due[kind] += self.interval(kind)
+        fired.sort(key=lambda entry: entry[0])
+        spawns = []
+        for _, kind in fired:
+            if live >= settings.SPAWN_ENTITY_CAP:
+                self.stats["capped"] += 1
+                continue
+            live += 1
+            spawns.append(kind)
+            self.stats["spawned"][kind] += 1
+        return spawns
+
+    def record_frame(self, work, frame_dt):
+        """Feeds the throttle the seconds spent simulating and drawing a frame of frame_dt seconds."""
+        if not settings.SPAWN_THROTTLE:
+            return
+        self.window_work += work
+        self.window_frames += 1
+        self.window_time += frame_dt
+        if self.window_time < settings.SPAWN_THROTTLE_WINDOW:
+            return
+        load = self.window_work / self.window_frames * settings.FPS
+        self.window_work = 0.0
+        self.window_frames = 0
+        self.window_time = 0.0
+        if load > settings.SPAWN_THROTTLE_HIGH:
+            rate = max(settings.SPAWN_THROTTLE_MIN_RATE, self.rate - settings.SPAWN_THROTTLE_STEP)
+        elif load < settings.SPAWN_THROTTLE_LOW:
+            rate = min(1.0, self.rate + settings.SPAWN_THROTTLE_STEP)
+        else:
+            return
+        # Rounded, so the steps add up to exactly 1.0 again.
+        rate = round(rate, 2)
+        if rate == self.rate:
+            return
+        self.set_rate(rate)
+        budget_ms = 1000.0 / settings.FPS
+        if rate < 1.0:
+            print(f"Spawn director: throttling enemy spawns to {rate:.0%} "
+                  f"(frames use {load:.0%} of the {budget_ms:.1f} ms budget)")
+        else:
+            print(f"Spawn director: enemy spawns back to full rate "
+                  f"(frames use {load:.0%} of the {budget_ms:.1f} ms budget)")
+
+    def set_rate(self, rate):
+        """Sets the throttle rate; spawns already scheduled keep their time."""
+        if rate != self.rate:
+            self.stats["throttle_changes"] += 1
+        self.rate = rate
+        self.stats["min_rate"] = min(self.stats["min_rate"], rate)
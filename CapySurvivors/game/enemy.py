@@ -1,8 +1,13 @@
 # game/enemy.py
-import random
 import pygame
 from game import settings
+from game.assets import load_animation
 from game.bullet import BossBullet
+from game.horde import DIRECTIONS
+from game.lod import TIER_VISIBLE
+from game.rng import rng
+from game.soa import ArrayField
+from game.timestep import interpolated_rect
 
 class BaseEnemy(pygame.sprite.Sprite):
     """
@@ -12,30 +17,44 @@ class BaseEnemy(pygame.sprite.Sprite):
       - pausing,
       - taking damage.
     Subclasses override speed, health, sprite paths, or sizes.
+    While inside a HordeGroup, the ArrayField attributes live in the group's
+    arrays and the group moves the enemy instead of update().
+    The enemy group sets flow_field; where it has a direction, the enemy
+    follows it around obstacles instead of heading straight at the target.
+    It also sets update_tiers (except for bosses) and lod_phase: off-screen,
+    the enemy moves only on the ticks its tier is due (by the dt saved up
+    since) and does not animate.
     """
+    horde_managed = True
+    array_group = None
+    slot = -1
+    flow_field = None
+    update_tiers = None
+    lod_phase = 0
+    lod_dt = 0.0
+
+    pos = ArrayField()
+    speed = ArrayField()
+    health = ArrayField()
+    animation_timer = ArrayField()
+    current_frame = ArrayField()
+    current_direction = ArrayField(choices=DIRECTIONS)
+    paused = ArrayField()
+
     def __init__(self, pos, target, speed, health, image_prefix, image_count=4, size=(60, 90)):
         super().__init__()
-        self.animations = {"left": [], "right": []}
         self.size = size
 
-        # Load animation frames from assets/images/<image_prefix>/left_i_c.png and right_i_c.png
+        # Animation frames from assets/images/<image_prefix>/left_i_c.png and right_i_c.png
+        # (loaded and scaled once per process, then shared between enemies).
         try:
-            for i in range(1, image_count + 1):
-                img_left = pygame.image.load(f"assets/images/{image_prefix}/left_{i}_c.png").convert_alpha()
-                img_left = pygame.transform.scale(img_left, self.size)
-                self.animations["left"].append(img_left)
-
-            for i in range(1, image_count + 1):
-                img_right = pygame.image.load(f"assets/images/{image_prefix}/right_{i}_c.png").convert_alpha()
-                img_right = pygame.transform.scale(img_right, self.size)
-                self.animations["right"].append(img_right)
+            self.animations = load_animation(f"assets/images/{image_prefix}", image_count, self.size, suffix="_c")
         except Exception as e:
             print("Error loading enemy animations:", e)
             # Fallback: a plain placeholder
             placeholder = pygame.Surface(self.size)
             placeholder.fill((255, 0, 0))
-            self.animations["left"] = [placeholder]
-            self.animations["right"] = [placeholder]
+            self.animations = {"left": [placeholder], "right": [placeholder]}
 
         # Animation state
         self.current_direction = "right"
@@ -61,20 +80,36 @@ class BaseEnemy(pygame.sprite.Sprite):
         if self.paused:
             return
 
+        visible = True
+        if self.update_tiers is not None:
+            tier = self.update_tiers.tier_of(self.rect)
+            self.lod_dt += dt
+            if not self.update_tiers.is_due(tier, self.lod_phase):
+                return
+            dt, self.lod_dt = self.lod_dt, 0.0
+            visible = tier == TIER_VISIBLE
+
         # Determine target position (using player's intended_pos if available)
         if hasattr(self.target, "intended_pos"):
             target_pos = pygame.Vector2(self.target.intended_pos)
         else:
             target_pos = pygame.Vector2(self.target.rect.center)
 
-        direction_vector = target_pos - self.pos
-        if direction_vector.length() != 0:
-            direction_vector = direction_vector.normalize()
+        flow = self.flow_field.direction_at(self.pos.x, self.pos.y) if self.flow_field else None
+        if flow is not None:
+            direction_vector = pygame.Vector2(flow)
+        else:
+            direction_vector = target_pos - self.pos
+            if direction_vector.length() != 0:
+                direction_vector = direction_vector.normalize()
 
         # Move toward the target
         self.pos += direction_vector * self.speed * dt
         self.rect.center = (round(self.pos.x), round(self.pos.y))
 
+        if not visible:
+            return
+
         # Choose animation direction
         self.current_direction = "left" if target_pos.x < self.pos.x else "right"
 
@@ -96,19 +131,19 @@ class BaseEnemy(pygame.sprite.Sprite):
     @staticmethod
     def _spawn_position(screen_rect):
         # Randomly choose a side for the enemy to spawn from.
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = rng.choice(["top", "bottom", "left", "right"])
         if side == "top":
-            x = random.randint(screen_rect.left, screen_rect.right)
+            x = rng.randint(screen_rect.left, screen_rect.right)
             y = screen_rect.top - 50
         elif side == "bottom":
-            x = random.randint(screen_rect.left, screen_rect.right)
+            x = rng.randint(screen_rect.left, screen_rect.right)
             y = screen_rect.bottom + 50
         elif side == "left":
             x = screen_rect.left - 50
-            y = random.randint(screen_rect.top, screen_rect.bottom)
+            y = rng.randint(screen_rect.top, screen_rect.bottom)
         else:
             x = screen_rect.right + 50
-            y = random.randint(screen_rect.top, screen_rect.bottom)
+            y = rng.randint(screen_rect.top, screen_rect.bottom)
         return (x, y)
 
 
@@ -190,6 +225,8 @@ class EasyBoss(BaseEnemy):
       - Awards 100 score upon defeat.
       - Displays an HP bar.
     """
+    horde_managed = False
+
     def __init__(self, pos, target, bullet_group, speed=215, health=150):
         super().__init__(
             pos=pos,
@@ -215,11 +252,11 @@ class EasyBoss(BaseEnemy):
             direction = pygame.Vector2(self.target.rect.center) - self.pos
             if direction.length() != 0:
                 direction = direction.normalize()
-            bullet = BossBullet(self.rect.center, direction, speed=600)
+            bullet = BossBullet.create(self.rect.center, direction, speed=600)
             self.bullet_group.add(bullet)
 
-    def draw_hp_bar(self, surface, camera):
-        boss_rect = camera.apply(self)
+    def draw_hp_bar(self, surface, camera, alpha=1.0):
+        boss_rect = interpolated_rect(self, camera, alpha)
         bar_width = boss_rect.width
         bar_height = 10
         health_ratio = max(self.health, 0) / 150.0
@@ -259,6 +296,8 @@ class HardBoss(BaseEnemy):
       - Displays an HP bar.
       - Triggers sound effects.
     """
+    horde_managed = False
+
     def __init__(self, pos, target, bullet_group, enemy_group, sound_manager, speed=150, health=250):
         super().__init__(
             pos=pos,
@@ -290,7 +329,7 @@ class HardBoss(BaseEnemy):
             for i in range(num_bullets):
                 angle_deg = i * angle_increment
                 direction = pygame.Vector2(1, 0).rotate(angle_deg)
-                bullet = BossBullet(self.rect.center, direction, speed=600)
+                bullet = BossBullet.create(self.rect.center, direction, speed=600)
                 self.bullet_group.add(bullet)
             self.sound_manager.play_sound("hardboss_shoot")
 
@@ -298,12 +337,12 @@ class HardBoss(BaseEnemy):
         self.summon_timer += dt
         if self.summon_timer >= 2.0:
             self.summon_timer -= 2.0
-            summon_pos = (self.pos.x + random.randint(-30, 30), self.pos.y + random.randint(-20, 20))
+            summon_pos = (self.pos.x + rng.randint(-30, 30), self.pos.y + rng.randint(-20, 20))
             summon = Summon(summon_pos, self.target, speed=250, health=1)
             self.enemy_group.add(summon)
 
-    def draw_hp_bar(self, surface, camera):
-        boss_rect = camera.apply(self)
+    def draw_hp_bar(self, surface, camera, alpha=1.0):
+        boss_rect = interpolated_rect(self, camera, alpha)
         bar_width = boss_rect.width
         bar_height = 10
         health_ratio = max(self.health, 0) / 250.0
@@ -0,0 +1,180 @@
+# game/flowfield.py
+import math
+
+from game.soa import np
+
+# Step costs between neighbouring tiles (diagonals ~ sqrt(2)).
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14
+# Extra cost of entering a tile next to a wall or obstacle: enemies are wider
+# than a tile, so paths keep a tile of clearance where there is room.
+CLEARANCE_COST = 10
+
+# Tiles along its path a tile's direction points at. 1 gives only the 8
+# compass directions; looking further ahead smooths the zigzag of
+# diagonal and straight steps in open ground into a straight line.
+LOOKAHEAD = 2
+
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class FlowField:
+    """
+    Shared steering toward one target over the level's tile grid.
+      - update(target_pos) runs one Dijkstra pass outward from the target's
+        tile, but only when the target has moved to another tile; every tile
+        then knows the unit direction of the next step of its shortest path
+        around walls and obstacles.
+      - direction_at(x, y) and directions_at(positions) look that up in O(1)
+        per position.
+    There is no direction (and enemies steer straight at the target) in the
+    target's own tile, in solid or unreachable tiles and outside the level.
+    """
+    def __init__(self, level):
+        self.tile_size = level.tile_size
+        self.cols = level.cols
+        self.rows = level.rows
+        self.solid = level.solid
+        self.goal = None
+        self.recomputes = 0
+        count = self.cols * self.rows
+        # Per tile: (neighbour index, cost of stepping from it onto this tile)
+        # for every passable neighbour.
+        self.edges = [self._edges(index) for index in range(count)]
+        # Without NumPy, per tile unit (dx, dy) or None; else self.flow and self.valid.
+        self.directions = [None] * count
+        if np is not None:
+            # One extra row for positions outside the grid, which never has a direction.
+            self.flow = np.zeros((count + 1, 2))
+            self.valid = np.zeros(count + 1, dtype=bool)
+            tiles = np.arange(count)
+            self.tile_cols = tiles % self.cols
+            self.tile_rows = tiles // self.cols
+
+    def _edges(self, index):
+        cols, rows, solid = self.cols, self.rows, self.solid
+        if solid[index]:
+            return ()
+        col, row = index % cols, index // cols
+        near_solid = False
+        for dx, dy in NEIGHBOURS:
+            x, y = col + dx, row + dy
+            if 0 <= x < cols and 0 <= y < rows and solid[y * cols + x]:
+                near_solid = True
+        # Entering this tile costs extra when it is next to something solid.
+        clearance = CLEARANCE_COST if near_solid else 0
+        edges = []
+        for dx, dy in NEIGHBOURS:
+            x, y = col + dx, row + dy
+            if not (0 <= x < cols and 0 <= y < rows) or solid[y * cols + x]:
+                continue
+            if dx and dy and (solid[row * cols + x] or solid[y * cols + col]):
+                continue  # No cutting across the corner of a solid tile.
+            edges.append((y * cols + x, (DIAGONAL_COST if dx and dy else STRAIGHT_COST) + clearance))
+        return tuple(edges)
+
+    def tile_index(self, x, y):
+        """Index of the tile under the world point (x, y), or -1 outside the level."""
+        col = int(x) // self.tile_size
+        row = int(y) // self.tile_size
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return -1
+
+    def update(self, target_pos):
+        """Recomputes the field if the target is on another tile; returns True if it did."""
+        goal = self.tile_index(*target_pos)
+        if goal == self.goal:
+            return False
+        self.goal = goal
+        self._compute(goal)
+        self.recomputes += 1
+        return True
+
+    def _compute(self, goal):
+        count = self.cols * self.rows
+        parent = [-1] * count
+        if goal >= 0 and not self.solid[goal]:
+            # Dijkstra from the goal with a bucket queue (costs are small
+            # integers); each tile remembers the tile it was reached from,
+            # which is its next step toward the goal.
+            unreached = count * (DIAGONAL_COST + CLEARANCE_COST)
+            distance = [unreached] * count
+            distance[goal] = 0
+            # Every step costs at most DIAGONAL_COST + CLEARANCE_COST, so a
+            # ring of that many buckets (by distance modulo its size) is enough.
+            ring = DIAGONAL_COST + CLEARANCE_COST + 1
+            buckets = [[] for _ in range(ring)]
+            buckets[0].append(goal)
+            pending = 1
+            edges = self.edges
+            dist = 0
+            while pending:
+                bucket = buckets[dist % ring]
+                buckets[dist % ring] = []
+                pending -= len(bucket)
+                for index in bucket:
+                    if distance[index] != dist:
+                        continue
+                    for neighbour, cost in edges[index]:
+                        new_dist = dist + cost
+                        if new_dist < distance[neighbour]:
+                            distance[neighbour] = new_dist
+                            parent[neighbour] = index
+                            buckets[new_dist % ring].append(neighbour)
+                            pending += 1
+                dist += 1
+        self._set_directions(parent)
+
+    def _set_directions(self, parent):
+        """Points every tile with a path at the tile LOOKAHEAD steps ahead on it (or the goal)."""
+        cols = self.cols
+        count = len(parent)
+        if np is not None:
+            parent = np.array(parent)
+            ahead = parent
+            for _ in range(LOOKAHEAD - 1):
+                further = np.where(ahead >= 0, parent[ahead], -1)
+                ahead = np.where(further >= 0, further, ahead)
+            valid = parent >= 0
+            offset = np.stack((ahead % cols - self.tile_cols,
+                               ahead // cols - self.tile_rows), axis=1).astype(np.float64)
+            offset[~valid] = (1.0, 0.0)
+            offset /= np.hypot(offset[:, 0], offset[:, 1])[:, None]
+            offset[~valid] = 0.0
+            self.flow[:count] = offset
+            self.valid[:count] = valid
+            return
+        directions = [None] * count
+        for index, step in enumerate(parent):
+            if step < 0:
+                continue
+            for _ in range(LOOKAHEAD - 1):
+                if parent[step] < 0:
+                    break
+                step = parent[step]
+            dx = step % cols - index % cols
+            dy = step // cols - index // cols
+            length = math.hypot(dx, dy)
+            directions[index] = (dx / length, dy / length)
+        self.directions = directions
+
+    def direction_at(self, x, y):
+        """Unit (dx, dy) to move along from the world point (x, y), or None."""
+        index = self.tile_index(x, y)
+        if index < 0:
+            return None
+        if np is not None:
+            return tuple(self.flow[index].tolist()) if self.valid[index] else None
+        return self.directions[index]
+
+    def directions_at(self, positions):
+        """
+        Vectorized direction_at for an (N, 2) array of world positions:
+        returns the (N, 2) directions and an (N,) mask of which ones exist.
+        """
+        cols = np.floor_divide(positions[:, 0], self.tile_size).astype(np.int64)
+        rows = np.floor_divide(positions[:, 1], self.tile_size).astype(np.int64)
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        index = np.where(inside, rows * self.cols + cols, self.cols * self.rows)
+        return self.flow[index], self.valid[index]
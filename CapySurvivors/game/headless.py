@@ -0,0 +1,211 @@
+# game/headless.py
+"""
+Headless simulation of a full run, for load testing on machines without a display.
+
+Run from the game root:
+    python -m game.headless --difficulty hard --ticks 20000
+
+Uses SDL's dummy video/audio drivers, skips the dialog and menus, drives the
+player with an input policy and picks powerups with a powerup policy.
+The simulation runs as fast as possible on the fixed settings.SIM_RATE tick.
+
+Runs can be recorded (--record FILE) and recorded runs, including ones
+recorded in the game (settings.RECORD_REPLAYS), replayed (--replay FILE);
+see game/replay.py.
+"""
+import argparse
+import collections
+import json
+import os
+import random
+import time
+
+import pygame
+from game import settings
+from game.profiler import profiler
+
+# Ticks between autopilot shots (8 shots per second at 120 Hz).
+AUTOPILOT_SHOT_INTERVAL = 15
+
+
+def first_powerup(options, player):
+    """Always takes the left card."""
+    return options[0]
+
+
+def random_powerup(options, player):
+    """
+    Takes one of the offered cards at random. Like a player's choice this is
+    input, not game randomness, so it does not draw from the game RNG.
+    """
+    return random.choice(options)
+
+
+POWERUP_POLICIES = {
+    "first": first_powerup,
+    "random": random_powerup,
+}
+
+
+def autopilot(session, tick):
+    """
+    Default input policy: stands still and shoots at the nearest enemy.
+    Returns (keys_pressed, mouse_pos, clicks) in screen coordinates, where
+    clicks lists the positions of this tick's left clicks.
+    """
+    keys = collections.defaultdict(bool)
+    if tick % AUTOPILOT_SHOT_INTERVAL:
+        return keys, session.mouse_pos, ()
+    player_pos = session.player.pos
+    nearest = None
+    nearest_distance = None
+    for enemy in session.enemy_group:
+        distance = player_pos.distance_squared_to(enemy.rect.center)
+        if nearest_distance is None or distance < nearest_distance:
+            nearest = enemy
+            nearest_distance = distance
+    if nearest is None:
+        return keys, session.mouse_pos, ()
+    screen_pos = pygame.Vector2(nearest.rect.center) - pygame.Vector2(session.camera.camera_rect.topleft)
+    target = (round(screen_pos.x), round(screen_pos.y))
+    return keys, target, (target,)
+
+
+def init_headless_display():
+    """Initialises pygame on SDL's dummy video/audio drivers and returns an off-screen display surface."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+
+
+def run_headless(difficulty="easy", ticks=None, powerup_policy=first_powerup, input_policy=autopilot,
+                 render=False, sound_manager=None, seed=None, recorder_path=None):
+    """
+    Simulates one run without a window and returns its statistics.
+      - ticks: number of fixed ticks to simulate; None runs until the game
+        is over or complete.
+      - powerup_policy(options, player) returns one of the offered boost types.
+      - input_policy(session, tick) returns (keys_pressed, mouse_pos, clicks).
+      - render: also draw every tick to an off-screen display (counts towards timings).
+      - seed: seed of the game RNG (a fresh one if None).
+      - recorder_path: also record the run's input to this replay file.
+    """
+    screen = init_headless_display()
+
+    from game.session import GameSession, OUTCOME_COMPLETE, OUTCOME_POWERUP, OUTCOME_GAME_OVER
+    from game.powerup import offer_boosts
+    if sound_manager is None:
+        from game.sounds import SoundManager
+        sound_manager = SoundManager(volume=0.0)
+
+    from game.replay import InputRecorder
+    session = GameSession(difficulty, sound_manager, seed)
+    session.start_timers()
+    recorder = InputRecorder(session) if recorder_path else None
+    step_dt = 1.0 / settings.SIM_RATE
+    peaks = collections.Counter()
+
+    profiler_was_enabled = profiler.enabled
+    profiler.enabled = True
+    profiler.reset()
+    outcome = None
+    tick = 0
+    start = time.perf_counter()
+    while ticks is None or tick < ticks:
+        with profiler.scope("events"):
+            # The dummy window still posts events; nothing reads them.
+            pygame.event.clear()
+            keys_pressed, mouse_pos, clicks = input_policy(session, tick)
+            for pos in clicks:
+                if recorder:
+                    recorder.record_click(pos)
+                session.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+            session.mouse_pos = mouse_pos
+            if recorder:
+                recorder.record_tick(keys_pressed, mouse_pos)
+        outcome = session.step(step_dt, keys_pressed)
+        tick += 1
+        if render:
+            session.draw(screen)
+        for name, count in session.group_counts().items():
+            peaks[name] = max(peaks[name], count)
+
+        if outcome == OUTCOME_POWERUP:
+            chosen_boost = powerup_policy(list(offer_boosts(session.player)), session.player)
+            if recorder:
+                recorder.record_powerup(chosen_boost)
+            session.player.apply_boost(chosen_boost)
+            # run_game checks for a game over once the selection is closed.
+            if session.player.health <= 0:
+                outcome = OUTCOME_GAME_OVER
+                break
+        elif outcome in (OUTCOME_COMPLETE, OUTCOME_GAME_OVER):
+            break
+    wall_time = time.perf_counter() - start
+
+    session.stop_timers()
+    phases = profiler.summary()
+    profiler.enabled = profiler_was_enabled
+    outcome = outcome if outcome in (OUTCOME_COMPLETE, OUTCOME_GAME_OVER) else "running"
+    if recorder:
+        recorder.finish(outcome)
+        recorder.save(recorder_path)
+    return {
+        "difficulty": difficulty,
+        "seed": session.seed,
+        "ticks": tick,
+        "sim_seconds": tick * step_dt,
+        "wall_seconds": wall_time,
+        "outcome": outcome,
+        "score": session.score,
+        "kills": session.kills,
+        "player_health": session.player.health,
+        "peak_counts": dict(peaks),
+        "spawns": session.spawn_director.stats,
+        "phases": phases,
+    }
+
+
+def replay_headless(path, render=False, sound_manager=None):
+    """
+    Re-simulates a recorded run and returns its statistics, with
+    "replay_mismatches" listing where the result differs from the recording.
+    """
+    from game.replay import ReplayInput
+    replay = ReplayInput(path)
+    # The camera (and so every click's world position) depends on the screen size.
+    settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT = replay.screen
+    settings.SIM_RATE = replay.sim_rate
+    stats = run_headless(replay.difficulty, replay.ticks, replay.choose_powerup, replay,
+                         render=render, sound_manager=sound_manager, seed=replay.seed)
+    stats["replay_mismatches"] = replay.check(stats)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game without a display and print run statistics.")
+    parser.add_argument("--difficulty", choices=["easy", "hard"], default="easy")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="fixed ticks to simulate (default: until game over or completion)")
+    parser.add_argument("--powerups", choices=sorted(POWERUP_POLICIES), default="first",
+                        help="powerup selection policy")
+    parser.add_argument("--render", action="store_true", help="also draw every tick off-screen")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the game RNG (default: random)")
+    parser.add_argument("--record", metavar="FILE", help="record the run's input to a replay file")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay a recorded run instead (exits with status 1 if it ends differently)")
+    args = parser.parse_args()
+    if args.replay:
+        stats = replay_headless(args.replay, render=args.render)
+        print(json.dumps(stats, indent=2))
+        if stats["replay_mismatches"]:
+            raise SystemExit(1)
+        return
+    stats = run_headless(args.difficulty, args.ticks, POWERUP_POLICIES[args.powerups], render=args.render,
+                         seed=args.seed, recorder_path=args.record)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
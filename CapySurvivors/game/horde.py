@@ -0,0 +1,235 @@
+# game/horde.py
+import pygame
+from game import settings
+from game.lod import TIER_VISIBLE
+from game.soa import ArrayGroup, np
+
+# Seconds between animation frames (same as BaseEnemy.update).
+ANIMATION_DELAY = 0.2
+DIRECTIONS = ("left", "right")
+# The 3x3 block of grid cells around a cell, as (dx, dy).
+CELL_BLOCK = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1))
+# Golden angle, to spread sprites that sit exactly on top of each other.
+GOLDEN_ANGLE = 2.399963229728653
+
+
+def separation(pos, radius, max_per_cell):
+    """
+    For an (N, 2) array of positions, the (N, 2) push away from close neighbours:
+    the sum, over every other position closer than radius, of the unit vector
+    away from it weighted from 1 (touching) down to 0 (radius apart).
+    Neighbours are found through a grid of radius-sized cells: positions are
+    sorted by cell so every cell is one run, and each position only checks
+    the first max_per_cell positions of each of the 3x3 cells around it.
+    The cost is linear in N however tightly the positions are packed.
+    """
+    count = len(pos)
+    cells = np.floor_divide(pos, radius).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    width = int(cells[:, 0].max()) + 2
+    keys = cells[:, 1] * width + cells[:, 0]
+    # Work in cell order, so every cell is one contiguous run.
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    x = pos[order, 0]
+    y = pos[order, 1]
+
+    # Key of each of the 9 cells around every position, then the run of each.
+    block = np.array([dy * width + dx for dx, dy in CELL_BLOCK])
+    around = (keys[:, None] + block[None, :]).ravel()
+    start = np.searchsorted(keys, around, "left")
+    taken = np.minimum(np.searchsorted(keys, around, "right") - start, max_per_cell)
+    total = int(taken.sum())
+    push = np.zeros((count, 2))
+    if total == 0:
+        return push
+    # Expand every run into one (i, j) pair per neighbour.
+    i = np.repeat(np.arange(count).repeat(len(CELL_BLOCK)), taken)
+    j = np.repeat(start - (np.cumsum(taken) - taken), taken) + np.arange(total)
+
+    dx = x.take(i) - x.take(j)
+    dy = y.take(i) - y.take(j)
+    dist_sq = dx * dx + dy * dy
+    near = (dist_sq < radius * radius) & (i != j)
+    i, dx, dy = i[near], dx[near], dy[near]
+    dist = np.sqrt(dist_sq[near])
+    touching = dist == 0
+    if touching.any():
+        angle = order[i[touching]] * GOLDEN_ANGLE
+        dx[touching] = np.cos(angle)
+        dy[touching] = np.sin(angle)
+        dist[touching] = 1.0
+    weight = (1.0 - dist / radius) / dist
+    push[order, 0] = np.bincount(i, dx * weight, count)
+    push[order, 1] = np.bincount(i, dy * weight, count)
+    return push
+
+
+class HordeGroup(ArrayGroup):
+    """
+    Sprite group that moves its regular enemies with one vectorized NumPy step.
+      - Sprites with horde_managed = True get a slot in structure-of-arrays
+        storage (position, speed, health, animation timer, frame, direction).
+      - Every managed enemy chases the group's target in a single update,
+        then the rects and images of the sprites are synced for drawing and
+        collision, so the rest of the game keeps using them like sprites.
+      - With a flow field (game.flowfield), enemies follow its directions
+        around walls and obstacles instead of heading straight at the target.
+      - A separation pass (see separation()) pushes enemies apart so the
+        horde spreads around the target instead of stacking into one blob.
+      - With update tiers (game.lod), off-screen enemies move less often and
+        only on-screen ones animate; only the sprites that moved or animated
+        are synced.
+      - Other sprites (bosses) are updated one by one as usual.
+    """
+    # name: (dtype, trailing shape)
+    FIELDS = {
+        "pos": ("float64", (2,)),
+        "speed": ("float64", ()),
+        "health": ("int64", ()),
+        "animation_timer": ("float64", ()),
+        "current_frame": ("int64", ()),
+        "current_direction": ("int64", ()),
+        "paused": ("bool", ()),
+        "frame_count": ("int64", ()),
+        "push": ("float64", (2,)),
+        "lod_phase": ("int64", ()),
+        "lod_dt": ("float64", ()),
+    }
+    INTERNAL_FIELDS = ("frame_count", "push", "lod_phase", "lod_dt")
+
+    def __init__(self, target, capacity=256, flow_field=None, update_tiers=None):
+        super().__init__(capacity)
+        self.target = target
+        self.flow_field = flow_field
+        self.update_tiers = update_tiers
+        # Enemies added so far, which gives each its update phase.
+        self.added = 0
+        # Steps since the separation push was last computed.
+        self.separation_age = 0
+
+    def add_internal(self, sprite, layer=None):
+        # Before attach(), which copies the sprite's phase into the arrays.
+        join_enemy_group(self, sprite)
+        super().add_internal(sprite, layer)
+
+    def accepts(self, sprite):
+        return getattr(sprite, "horde_managed", False)
+
+    def attach(self, sprite, slot):
+        arrays = self.arrays
+        arrays["frame_count"][slot] = len(sprite.animations["right"])
+        arrays["push"][slot] = 0.0
+        arrays["lod_phase"][slot] = sprite.lod_phase
+        arrays["lod_dt"][slot] = 0.0
+
+    def step(self, dt):
+        """Advances every managed enemy toward the target in one vectorized step."""
+        count = len(self.members)
+        if count == 0:
+            return
+        arrays = self.arrays
+        pos = arrays["pos"][:count]
+        active = ~arrays["paused"][:count]
+
+        if hasattr(self.target, "intended_pos"):
+            target_x, target_y = self.target.intended_pos
+        else:
+            target_x, target_y = self.target.rect.center
+
+        # Which enemies move this tick (and by how much time), and which animate.
+        lod_dt = arrays["lod_dt"][:count]
+        if self.update_tiers is not None:
+            tiers = self.update_tiers.tiers(pos)
+            # Paused enemies do not save up movement.
+            lod_dt[:] = np.where(active, lod_dt + dt, 0.0)
+            moving = np.flatnonzero(active & self.update_tiers.due(tiers, arrays["lod_phase"][:count]))
+            animated = np.flatnonzero(active & (tiers == TIER_VISIBLE))
+            step_dt = lod_dt[moving]
+            lod_dt[moving] = 0.0
+        else:
+            moving = animated = np.flatnonzero(active)
+            step_dt = dt
+
+        if settings.SEPARATION_STRENGTH > 0 and count > 1:
+            # Crowds change slowly: the push is recomputed every
+            # SEPARATION_INTERVAL steps and kept per slot in between.
+            self.separation_age += 1
+            if self.separation_age >= settings.SEPARATION_INTERVAL:
+                self.separation_age = 0
+                arrays["push"][:count] = separation(pos, settings.SEPARATION_RADIUS,
+                                                    settings.SEPARATION_MAX_PER_CELL)
+
+        moved = pos[moving]
+        delta = np.array((target_x, target_y)) - moved
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        heading = np.zeros((len(moving), 2))
+        nonzero = length != 0
+        heading[nonzero] = delta[nonzero] / length[nonzero, None]
+        if self.flow_field is not None:
+            flow, known = self.flow_field.directions_at(moved)
+            heading[known] = flow[known]
+        if settings.SEPARATION_STRENGTH > 0 and count > 1:
+            heading += settings.SEPARATION_STRENGTH * arrays["push"][moving]
+            # Pushed or not, an enemy never moves faster than its speed.
+            norm = np.hypot(heading[:, 0], heading[:, 1])
+            over = norm > 1.0
+            heading[over] /= norm[over, None]
+        pos[moving] = moved + heading * (arrays["speed"][moving] * step_dt)[:, None]
+
+        # Face the target, then advance the walking animation.
+        arrays["current_direction"][animated] = target_x >= pos[animated, 0]
+        timer = arrays["animation_timer"]
+        timer[animated] += dt
+        flip = animated[timer[animated] >= ANIMATION_DELAY]
+        frame = arrays["current_frame"]
+        frame[flip] = (frame[flip] + 1) % arrays["frame_count"][flip]
+        timer[flip] = 0.0
+
+        self.sync_rects(count, moving)
+        self.sync_images(animated)
+
+    def sync_images(self, slots):
+        """Sets the image of the managed sprites in slots from their direction and frame."""
+        members = self.members
+        directions = self.arrays["current_direction"][slots].tolist()
+        frames = self.arrays["current_frame"][slots].tolist()
+        for slot, direction, frame in zip(slots.tolist(), directions, frames):
+            sprite = members[slot]
+            sprite.image = sprite.animations[DIRECTIONS[direction]][frame]
+
+
+def join_enemy_group(group, sprite):
+    """
+    Hands an enemy joining group the group's flow field, update tiers and an
+    update phase. Bosses (horde_managed = False) get no update tiers: their
+    shoot and summon timers run every tick, so they move every tick too.
+    """
+    sprite.flow_field = group.flow_field
+    if getattr(sprite, "horde_managed", False):
+        sprite.update_tiers = group.update_tiers
+    sprite.lod_phase = group.added
+    group.added += 1
+
+
+class EnemyGroup(pygame.sprite.Group):
+    """
+    Plain sprite group that hands its flow field and update tiers to the
+    enemies added to it (see join_enemy_group).
+    """
+    def __init__(self, flow_field=None, update_tiers=None):
+        super().__init__()
+        self.flow_field = flow_field
+        self.update_tiers = update_tiers
+        self.added = 0
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        join_enemy_group(self, sprite)
+
+
+def make_enemy_group(target, flow_field=None, update_tiers=None):
+    """Returns a HordeGroup when NumPy is available and enabled, else an EnemyGroup."""
+    if np is not None and settings.USE_HORDE_ENGINE:
+        return HordeGroup(target, flow_field=flow_field, update_tiers=update_tiers)
+    return EnemyGroup(flow_field, update_tiers)
@@ -1,6 +1,14 @@
 # game/item.py
 import pygame
 from game import settings
+from game.assets import load_image
+
+# Image file for each item type.
+ITEM_IMAGES = {
+    "heal": "assets/images/heal.png",
+    "speed": "assets/images/boots.png",
+    "freezer": "assets/images/freezer.png",
+}
 
 class Item(pygame.sprite.Sprite):
     def __init__(self, pos, item_type):
@@ -14,17 +22,11 @@ class Item(pygame.sprite.Sprite):
         self.pos = pygame.Vector2(pos)
 
         try:
-            if item_type == "heal":
-                self.image = pygame.image.load("assets/images/heal.png").convert_alpha()
-            elif item_type == "speed":
-                self.image = pygame.image.load("assets/images/boots.png").convert_alpha()
-            elif item_type == "freezer":
-                self.image = pygame.image.load("assets/images/freezer.png").convert_alpha()
-            else:
+            if item_type not in ITEM_IMAGES:
                 raise ValueError(f"Unknown item type: {item_type}")
 
-            # Scale the image to a standard size.
-            self.image = pygame.transform.scale(self.image, (45, 45))
+            # Scaled to a standard size.
+            self.image = load_image(ITEM_IMAGES[item_type], (45, 45))
         
         except Exception as e:
             print(f"Error loading {item_type} image:", e)
@@ -1,6 +1,7 @@
 # game/level.py
 import pygame
 from game import settings
+from game.assets import load_image
 
 # Define extra colors for tiles.
 LIGHT_GRAY = (200, 200, 200)
@@ -9,6 +10,30 @@ BROWN = (139, 69, 19)
 WHITE = (255, 255, 255)
 GREEN = (50, 205, 50)
 
+# Size (in pixels) of the square chunks the static level layer is baked into.
+CHUNK_SIZE = 512
+BACKGROUND_IMAGE = "assets/images/bg3.png"
+
+# Non-empty lines of each level file read so far, by filename.
+_level_data_cache = {}
+
+
+def load_level_data(filename):
+    """Reads a level file once and returns its non-empty, stripped rows. Thread-safe."""
+    rows = _level_data_cache.get(filename)
+    if rows is None:
+        with open(filename, "r") as f:
+            data = f.readlines()
+        rows = [line.strip() for line in data if line.strip()]
+        _level_data_cache[filename] = rows
+    return rows
+
+
+def level_size(filename, tile_size=50):
+    """Pixel size (width, height) of a level, which its background is scaled to."""
+    rows = load_level_data(filename)
+    return max(len(line) for line in rows) * tile_size, len(rows) * tile_size
+
 class Tile(pygame.sprite.Sprite):
     def __init__(self, pos, tile_type, tile_size):
         super().__init__()
@@ -20,8 +45,7 @@ class Tile(pygame.sprite.Sprite):
             self.image.fill(WHITE)
             self.image.set_alpha(256)
         elif tile_type == "obstacle":
-            self.image = pygame.image.load("assets/images/bochka.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (tile_size, tile_size))
+            self.image = load_image("assets/images/bochka.png", (tile_size, tile_size))
         else:
             self.image.fill((0, 0, 0))  # Default color.
         self.rect = self.image.get_rect(topleft=pos)
@@ -33,15 +57,19 @@ class Level:
         self.walls = pygame.sprite.Group()
         self.player_start = None
         self.background = None
+        self.chunks = []
         self.load_level(filename)
         self.load_background()
+        self.bake_chunks()
 
     def load_level(self, filename):
-        with open(filename, "r") as f:
-            data = f.readlines()
-        self.level_data = [line.strip() for line in data if line.strip()]
-        self.height = len(self.level_data) * self.tile_size
-        self.width = max(len(line) for line in self.level_data) * self.tile_size
+        self.level_data = load_level_data(filename)
+        self.rows = len(self.level_data)
+        self.cols = max(len(line) for line in self.level_data)
+        self.height = self.rows * self.tile_size
+        self.width = self.cols * self.tile_size
+        # Occupancy grid (row-major, one byte per cell): 1 for walls and obstacles.
+        self.solid = bytearray(self.rows * self.cols)
 
         for row_idx, row in enumerate(self.level_data):
             for col_idx, cell in enumerate(row):
@@ -50,6 +78,7 @@ class Level:
                     tile = Tile(pos, "wall", self.tile_size)
                     self.tiles.add(tile)
                     self.walls.add(tile)
+                    self.solid[row_idx * self.cols + col_idx] = 1
                 elif cell == ".":
                     tile = Tile(pos, "floor", self.tile_size)
                     self.tiles.add(tile)
@@ -57,6 +86,7 @@ class Level:
                     tile = Tile(pos, "obstacle", self.tile_size)
                     self.tiles.add(tile)
                     self.walls.add(tile)
+                    self.solid[row_idx * self.cols + col_idx] = 1
                 elif cell == "P":
                     tile = Tile(pos, "floor", self.tile_size)
                     self.tiles.add(tile)
@@ -65,19 +95,83 @@ class Level:
                     tile = Tile(pos, "floor", self.tile_size)
                     self.tiles.add(tile)
 
+    def point_blocked(self, x, y):
+        """True if the world point (x, y) lies inside a wall or obstacle tile."""
+        col = int(x) // self.tile_size
+        row = int(y) // self.tile_size
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.solid[row * self.cols + col] == 1
+        return False
+
+    def rect_blocked(self, rect):
+        """
+        True if rect overlaps any wall or obstacle tile.
+        Only the few cells under rect are checked, so the cost does not depend
+        on how many walls the level has. Matches spritecollideany(rect, walls).
+        """
+        size = self.tile_size
+        first_col = max(0, rect.left // size)
+        last_col = min(self.cols - 1, (rect.right - 1) // size)
+        first_row = max(0, rect.top // size)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // size)
+        if first_col > last_col:
+            return False
+        solid = self.solid
+        for row in range(first_row, last_row + 1):
+            row_start = row * self.cols
+            if 1 in solid[row_start + first_col:row_start + last_col + 1]:
+                return True
+        return False
+
     def load_background(self):
         try:
-            bg = pygame.image.load("assets/images/bg3.png").convert()
-            self.background = pygame.transform.scale(bg, (self.width, self.height))
+            self.background = load_image(BACKGROUND_IMAGE, (self.width, self.height), alpha=False)
             print("Background loaded successfully:", self.background)
         except Exception as e:
             print("Error loading background image:", e)
             self.background = None
 
-    def draw(self, surface, camera):
-        if self.background:
-            bg_rect = pygame.Rect(0, 0, self.width, self.height)
-            surface.blit(self.background, camera.apply_rect(bg_rect))
+    def bake_chunks(self):
+        """
+        Pre-renders the background and every tile into CHUNK_SIZE x CHUNK_SIZE
+        surfaces once, so drawing the level only costs a few blits per frame.
+        Chunks are stored row by row in self.chunks as (rect, surface) pairs.
+        """
+        self.chunk_cols = -(-self.width // CHUNK_SIZE)
+        self.chunk_rows = -(-self.height // CHUNK_SIZE)
+        self.chunks = []
+        for chunk_y in range(self.chunk_rows):
+            for chunk_x in range(self.chunk_cols):
+                left = chunk_x * CHUNK_SIZE
+                top = chunk_y * CHUNK_SIZE
+                chunk_rect = pygame.Rect(left, top,
+                                         min(CHUNK_SIZE, self.width - left),
+                                         min(CHUNK_SIZE, self.height - top))
+                chunk = pygame.Surface(chunk_rect.size).convert()
+                chunk.fill(settings.BLACK)
+                if self.background:
+                    chunk.blit(self.background, (0, 0), chunk_rect)
+                self.chunks.append((chunk_rect, chunk))
+
+        # Blit each tile into every chunk it overlaps.
         for tile in self.tiles:
-            surface.blit(tile.image, camera.apply_rect(tile.rect))
+            for chunk_rect, chunk in self.visible_chunks(tile.rect):
+                chunk.blit(tile.image, (tile.rect.x - chunk_rect.x, tile.rect.y - chunk_rect.y))
 
+    def visible_chunks(self, view_rect):
+        """Returns the (rect, surface) chunks that overlap view_rect (world coordinates)."""
+        first_col = max(0, view_rect.left // CHUNK_SIZE)
+        last_col = min(self.chunk_cols - 1, (view_rect.right - 1) // CHUNK_SIZE)
+        first_row = max(0, view_rect.top // CHUNK_SIZE)
+        last_row = min(self.chunk_rows - 1, (view_rect.bottom - 1) // CHUNK_SIZE)
+        visible = []
+        for chunk_y in range(first_row, last_row + 1):
+            row_start = chunk_y * self.chunk_cols
+            for chunk_x in range(first_col, last_col + 1):
+                visible.append(self.chunks[row_start + chunk_x])
+        return visible
+
+    def draw(self, surface, camera):
+        offset_x, offset_y = camera.camera_rect.topleft
+        surface.blits([(chunk, (chunk_rect.x - offset_x, chunk_rect.y - offset_y))
+                       for chunk_rect, chunk in self.visible_chunks(camera.camera_rect)], doreturn=False)
@@ -0,0 +1,66 @@
+# game/lod.py
+import pygame
+from game import settings
+from game.soa import np
+
+# Update tiers, from the camera outward (see settings.LOD_INTERVALS).
+TIER_VISIBLE = 0
+TIER_NEAR = 1
+TIER_FAR = 2
+
+
+class UpdateTiers:
+    """
+    Level-of-detail scheduling for enemy updates by distance from the view:
+      - TIER_VISIBLE: within settings.LOD_VISIBLE_MARGIN of the camera view;
+        updated and animated every tick.
+      - TIER_NEAR: within settings.LOD_NEAR_MARGIN; moved every few ticks.
+      - TIER_FAR: everything else; moved rarely.
+    An enemy that skips ticks accumulates their dt and moves by all of it on
+    its next due tick, so it covers the same ground, in fewer steps. Off-screen
+    enemies do not step their animation.
+    Tiers are worked out again every tick from the current view, so an enemy
+    the camera approaches is promoted right away; the visible margin keeps
+    its catch-up step out of sight.
+    Each enemy has a phase (its order of arrival in the group) so the enemies
+    of a tier are spread over the ticks instead of all moving on the same one.
+    """
+    def __init__(self):
+        self.tick = 0
+        self.visible_rect = pygame.Rect(0, 0, 0, 0)
+        self.near_rect = pygame.Rect(0, 0, 0, 0)
+        if np is not None:
+            self.intervals = np.array(settings.LOD_INTERVALS)
+
+    def update(self, view_rect):
+        """Starts a new tick with the camera at view_rect."""
+        self.tick += 1
+        visible = settings.LOD_VISIBLE_MARGIN
+        near = settings.LOD_NEAR_MARGIN
+        self.visible_rect = view_rect.inflate(2 * visible, 2 * visible)
+        self.near_rect = view_rect.inflate(2 * near, 2 * near)
+
+    def tier_of(self, rect):
+        if self.visible_rect.colliderect(rect):
+            return TIER_VISIBLE
+        if self.near_rect.colliderect(rect):
+            return TIER_NEAR
+        return TIER_FAR
+
+    def is_due(self, tier, phase):
+        """True if an enemy of this tier and phase moves this tick."""
+        return (self.tick + phase) % settings.LOD_INTERVALS[tier] == 0
+
+    def tiers(self, pos):
+        """Vectorized tier of an (N, 2) array of sprite centres."""
+        x = pos[:, 0]
+        y = pos[:, 1]
+        tiers = np.full(len(pos), TIER_FAR)
+        for tier, rect in ((TIER_NEAR, self.near_rect), (TIER_VISIBLE, self.visible_rect)):
+            inside = (x >= rect.left) & (x < rect.right) & (y >= rect.top) & (y < rect.bottom)
+            tiers[inside] = tier
+        return tiers
+
+    def due(self, tiers, phases):
+        """Vectorized is_due for arrays of tiers and phases."""
+        return (self.tick + phases) % self.intervals[tiers] == 0
@@ -1,8 +1,13 @@
 import pygame
 from game import settings
+from game.assets import load_image, overlay_surface, render_text
 import json
 import os
 
+MENU_BACKGROUND = "assets/images/main_menu_bg.png"
+GAME_NAME_IMAGE = "assets/images/game_name.png"
+GAME_NAME_SIZE = (375, 275)
+
 class MenuItem:
     def __init__(self, text, position, font, color=settings.WHITE, selected_color=settings.RED):
         self.text = text
@@ -10,48 +15,90 @@ class MenuItem:
         self.font = font
         self.color = color
         self.selected_color = selected_color
-        self.label = self.font.render(self.text, True, self.color)
+        self.label = render_text(self.font, self.text, self.color)
         self.rect = self.label.get_rect(center=self.position)
 
     def draw(self, screen, is_selected):
         if is_selected:
-            label = self.font.render(self.text, True, self.selected_color)
+            label = render_text(self.font, self.text, self.selected_color)
         else:
-            label = self.font.render(self.text, True, self.color)
+            label = render_text(self.font, self.text, self.color)
         screen.blit(label, self.rect)
 
     def is_mouse_over(self, mouse_pos):
         return self.rect.collidepoint(mouse_pos)
 
+def wait_events(timeout=None):
+    """
+    Blocks until an event arrives or timeout milliseconds pass
+    (settings.MENU_WAIT_TIMEOUT by default), then returns every pending event.
+    Menus use this instead of polling at settings.FPS, so an idle menu sleeps.
+    """
+    if timeout is None:
+        timeout = settings.MENU_WAIT_TIMEOUT
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+
+def is_expose_event(event):
+    """True for events after which the whole window has to be redrawn."""
+    return event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+
 class BaseMenu:
+    """
+    Menu of MenuItems, redrawn only when something changes:
+      - draw() paints the whole screen: draw_background() (override it for
+        images and panels), then the items, and keeps a copy of the background.
+      - When the selection moves, only the two affected items are restored
+        from that copy, redrawn and pushed with pygame.display.update(rects).
+    """
     def __init__(self, screen, items, bg_color=settings.BLACK):
         self.screen = screen
         self.items = items  # List of MenuItem objects.
         self.bg_color = bg_color
         self.selected_index = 0
+        self.background = None
 
-    def draw(self):
-        # This basic draw method can be overridden.
+    def draw_background(self):
+        # This basic background can be overridden.
         self.screen.fill(self.bg_color)
+
+    def draw(self):
+        self.draw_background()
+        self.background = self.screen.copy()
         for index, item in enumerate(self.items):
             is_selected = (index == self.selected_index)
             item.draw(self.screen, is_selected)
         pygame.display.flip()
 
+    def draw_items(self, indices):
+        """Redraws just the given items over the cached background."""
+        rects = []
+        for index in set(indices):
+            item = self.items[index]
+            self.screen.blit(self.background, item.rect, item.rect)
+            item.draw(self.screen, index == self.selected_index)
+            rects.append(item.rect)
+        pygame.display.update(rects)
+
     def run(self):
-        clock = pygame.time.Clock()
+        self.draw()
         selected_option = None
-        running = True
-        while running:
-            clock.tick(settings.FPS)
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
+        while selected_option is None:
+            previous_index = self.selected_index
+            redraw_all = False
+            for event in wait_events():
                 if event.type == pygame.QUIT:
                     selected_option = "quit"
-                    running = False
+                    break
+                elif is_expose_event(event):
+                    redraw_all = True
                 elif event.type == pygame.MOUSEMOTION:
                     for index, item in enumerate(self.items):
-                        if item.is_mouse_over(mouse_pos):
+                        if item.is_mouse_over(event.pos):
                             self.selected_index = index
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:
@@ -59,7 +106,7 @@ class BaseMenu:
                             if item.is_mouse_over(event.pos):
                                 self.selected_index = index
                                 selected_option = item.text.lower()
-                                running = False
+                                break
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_UP:
                         self.selected_index = (self.selected_index - 1) % len(self.items)
@@ -67,26 +114,31 @@ class BaseMenu:
                         self.selected_index = (self.selected_index + 1) % len(self.items)
                     elif event.key == pygame.K_RETURN:
                         selected_option = self.items[self.selected_index].text.lower()
-                        running = False
-            self.draw()
+                        break
+                if selected_option is not None:
+                    break
+            if selected_option is not None:
+                break
+            if redraw_all:
+                self.draw()
+            elif self.selected_index != previous_index:
+                self.draw_items((previous_index, self.selected_index))
         return selected_option
 
-class MainMenu:
+class MainMenu(BaseMenu):
     def __init__(self, screen):
         self.screen = screen
         self.font = pygame.font.Font(None, 50)
         self.menu_items = []
         # --- Load background image ---
         try:
-            self.bg_image = pygame.image.load("assets/images/main_menu_bg.png").convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+            self.bg_image = load_image(MENU_BACKGROUND, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), alpha=False)
         except Exception as e:
             print("Error loading main menu background:", e)
             self.bg_image = None
         # --- Load game name image ---
         try:
-            self.game_name_img = pygame.image.load("assets/images/game_name.png").convert_alpha()
-            self.game_name_img = pygame.transform.scale(self.game_name_img, (375, 275))
+            self.game_name_img = load_image(GAME_NAME_IMAGE, GAME_NAME_SIZE)
         except Exception as e:
             print("Error loading game name image:", e)
             self.game_name_img = self.font.render("GAME NAME", True, settings.WHITE)
@@ -104,9 +156,9 @@ class MainMenu:
             pos_x = self.panel_rect.centerx
             pos_y = self.panel_rect.top + (i + 1) * spacing
             self.menu_items.append(MenuItem(text, (pos_x, pos_y), self.font))
-        self.selected_index = 0
+        super().__init__(screen, self.menu_items)
 
-    def draw(self):
+    def draw_background(self):
         # Draw the background image.
         if self.bg_image:
             self.screen.blit(self.bg_image, (0, 0))
@@ -116,57 +168,16 @@ class MainMenu:
         game_name_rect = self.game_name_img.get_rect(midtop=(settings.SCREEN_WIDTH // 2, 5))
         self.screen.blit(self.game_name_img, game_name_rect)
         # Draw a semi-transparent black panel for the menu options.
-        panel_surface = pygame.Surface((self.panel_rect.width, self.panel_rect.height), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 200))
-        self.screen.blit(panel_surface, (self.panel_rect.x, self.panel_rect.y))
-        # Draw each menu item onto the panel.
-        for index, item in enumerate(self.menu_items):
-            is_selected = (index == self.selected_index)
-            item.draw(self.screen, is_selected)
-        pygame.display.flip()
-
-    def run(self):
-        clock = pygame.time.Clock()
-        selected_option = None
-        running = True
-        while running:
-            clock.tick(settings.FPS)
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    selected_option = "quit"
-                    running = False
-                elif event.type == pygame.MOUSEMOTION:
-                    for index, item in enumerate(self.menu_items):
-                        if item.is_mouse_over(mouse_pos):
-                            self.selected_index = index
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        for index, item in enumerate(self.menu_items):
-                            if item.is_mouse_over(event.pos):
-                                self.selected_index = index
-                                selected_option = item.text.lower()
-                                running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        self.selected_index = (self.selected_index - 1) % len(self.menu_items)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected_index = (self.selected_index + 1) % len(self.menu_items)
-                    elif event.key == pygame.K_RETURN:
-                        selected_option = self.menu_items[self.selected_index].text.lower()
-                        running = False
-            self.draw()
-        return selected_option
+        self.screen.blit(overlay_surface((0, 0, 0, 200), self.panel_rect.size), (self.panel_rect.x, self.panel_rect.y))
 
-class PauseMenu:
+class PauseMenu(BaseMenu):
     def __init__(self, screen):
         self.screen = screen
         self.font = pygame.font.Font(None, 50)
         self.menu_items = []
         # --- Load background image for the pause menu (reuse main menu bg) ---
         try:
-            self.bg_image = pygame.image.load("assets/images/main_menu_bg.png").convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+            self.bg_image = load_image(MENU_BACKGROUND, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), alpha=False)
         except Exception as e:
             print("Error loading background for pause menu:", e)
             self.bg_image = None
@@ -184,56 +195,16 @@ class PauseMenu:
             pos_x = self.panel_rect.centerx
             pos_y = self.panel_rect.top + (i + 1) * spacing
             self.menu_items.append(MenuItem(text, (pos_x, pos_y), self.font))
-        self.selected_index = 0
+        super().__init__(screen, self.menu_items)
 
-    def draw(self):
+    def draw_background(self):
         # Draw the background image if available; otherwise fill with black.
         if self.bg_image:
             self.screen.blit(self.bg_image, (0, 0))
         else:
             self.screen.fill(settings.BLACK)
         # Draw a semi–transparent panel for the menu options.
-        panel_surface = pygame.Surface((self.panel_rect.width, self.panel_rect.height), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 200))
-        self.screen.blit(panel_surface, (self.panel_rect.x, self.panel_rect.y))
-        # Draw each menu item onto the panel.
-        for index, item in enumerate(self.menu_items):
-            is_selected = (index == self.selected_index)
-            item.draw(self.screen, is_selected)
-        pygame.display.flip()
-
-    def run(self):
-        clock = pygame.time.Clock()
-        selected_option = None
-        running = True
-        while running:
-            clock.tick(settings.FPS)
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    selected_option = "quit"
-                    running = False
-                elif event.type == pygame.MOUSEMOTION:
-                    for index, item in enumerate(self.menu_items):
-                        if item.is_mouse_over(mouse_pos):
-                            self.selected_index = index
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        for index, item in enumerate(self.menu_items):
-                            if item.is_mouse_over(event.pos):
-                                self.selected_index = index
-                                selected_option = item.text.lower()
-                                running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        self.selected_index = (self.selected_index - 1) % len(self.menu_items)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected_index = (self.selected_index + 1) % len(self.menu_items)
-                    elif event.key == pygame.K_RETURN:
-                        selected_option = self.menu_items[self.selected_index].text.lower()
-                        running = False
-            self.draw()
-        return selected_option
+        self.screen.blit(overlay_surface((0, 0, 0, 200), self.panel_rect.size), (self.panel_rect.x, self.panel_rect.y))
 
 class OptionsMenu:
     """
@@ -249,8 +220,7 @@ class OptionsMenu:
         self.volume = self.load_volume()
         # --- Load background image (reuse main menu background if available) ---
         try:
-            self.bg_image = pygame.image.load("assets/images/main_menu_bg.png").convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+            self.bg_image = load_image(MENU_BACKGROUND, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), alpha=False)
         except Exception as e:
             print("Error loading background for options:", e)
             self.bg_image = None
@@ -283,27 +253,38 @@ class OptionsMenu:
         panel_height = int(settings.SCREEN_HEIGHT * 0.3)
         panel_x = (settings.SCREEN_WIDTH - panel_width) // 2
         panel_y = (settings.SCREEN_HEIGHT - panel_height) // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        panel_surface = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 200))
-        self.screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
-        vol_text = self.font.render("Sound Volume: " + str(round(self.volume, 1)), True, settings.WHITE)
-        instruction = self.small_font.render("Use LEFT/RIGHT to adjust, ENTER to confirm", True, settings.WHITE)
-        vol_text_rect = vol_text.get_rect(center=(panel_rect.centerx, panel_rect.centery - 20))
-        instruction_rect = instruction.get_rect(center=(panel_rect.centerx, panel_rect.centery + 30))
-        self.screen.blit(vol_text, vol_text_rect)
+        self.panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        self.screen.blit(overlay_surface((0, 0, 0, 200), self.panel_rect.size), self.panel_rect.topleft)
+        instruction = render_text(self.small_font, "Use LEFT/RIGHT to adjust, ENTER to confirm", settings.WHITE)
+        instruction_rect = instruction.get_rect(center=(self.panel_rect.centerx, self.panel_rect.centery + 30))
         self.screen.blit(instruction, instruction_rect)
+        # Everything but the volume text stays the same; keep it for draw_volume.
+        self.background = self.screen.copy()
+        self.vol_text_rect = None
+        self.draw_volume()
         pygame.display.flip()
 
+    def draw_volume(self):
+        """Redraws only the volume text; returns the screen area that changed."""
+        vol_text = render_text(self.font, "Sound Volume: " + str(round(self.volume, 1)), settings.WHITE)
+        vol_text_rect = vol_text.get_rect(center=(self.panel_rect.centerx, self.panel_rect.centery - 20))
+        dirty = vol_text_rect.union(self.vol_text_rect) if self.vol_text_rect else vol_text_rect
+        self.screen.blit(self.background, dirty, dirty)
+        self.screen.blit(vol_text, vol_text_rect)
+        self.vol_text_rect = vol_text_rect
+        return dirty
+
     def run(self):
-        clock = pygame.time.Clock()
+        self.draw()
         running = True
         while running:
-            clock.tick(settings.FPS)
-            for event in pygame.event.get():
+            volume = self.volume
+            redraw_all = False
+            for event in wait_events():
                 if event.type == pygame.QUIT:
-                    running = False
                     return "quit"
+                elif is_expose_event(event):
+                    redraw_all = True
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_LEFT:
                         self.volume = max(0.0, self.volume - 0.1)
@@ -311,7 +292,10 @@ class OptionsMenu:
                         self.volume = min(1.0, self.volume + 0.1)
                     elif event.key == pygame.K_RETURN:
                         running = False
-            self.draw()
+            if redraw_all:
+                self.draw()
+            elif self.volume != volume:
+                pygame.display.update(self.draw_volume())
         self.save_volume()
         pygame.mixer.music.set_volume(self.volume)
         return "options_saved"
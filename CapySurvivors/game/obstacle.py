@@ -1,17 +1,18 @@
 # game/obstacle.py
 import pygame
 from game import settings
+from game.assets import load_image
 
 class Obstacle(pygame.sprite.Sprite):
     """
     An obstacle that prevents player movement.
-    (Enemies will ignore obstacles.)
+    (Enemies do not collide with obstacles; they steer around the level's
+    obstacle tiles with the flow field from game.flowfield.)
     """
     def __init__(self, pos, size=(50, 50)):
         super().__init__()
         try:
-            self.image = pygame.image.load("assets/images/bochka.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, size)
+            self.image = load_image("assets/images/bochka.png", size)
         except Exception as e:
             self.image = pygame.Surface(size)
             self.image.fill((139, 69, 19))  # Brown color.
@@ -2,8 +2,10 @@
 import pygame
 import math
 from game import settings
+from game.assets import load_animation, load_image
 import random
 from game.bullet import Bullet, LaserBullet
+from game.timestep import interpolated_rect
 
 try:
     from game.bullet import Bullet
@@ -22,6 +24,40 @@ except ImportError:
             self.rect.x += displacement.x
             self.rect.y += displacement.y
 
+# Temporary pickup effects: duration in seconds and ring color.
+EFFECT_DURATIONS = {"heal": 3.0, "speed": 3.0, "coin": 2.0}
+EFFECT_COLORS = {"heal": (0, 255, 0), "speed": (0, 0, 255), "coin": (255, 255, 0)}
+# The shield pulses once per second; its scaled frames are precomputed at this many per pulse.
+SHIELD_PULSE_FRAMES = 60
+
+
+def make_shield_frames(image, base_size):
+    """
+    One scaled shield image per frame of a one-second pulse (1.0 +- 0.2 of
+    base_size, plus a 20px margin). Frames of equal size share a surface.
+    """
+    by_size = {}
+    frames = []
+    for i in range(SHIELD_PULSE_FRAMES):
+        pulsate = 1.0 + 0.2 * math.sin(2 * math.pi * i / SHIELD_PULSE_FRAMES)
+        size = (int(base_size[0] * pulsate) + 20, int(base_size[1] * pulsate) + 20)
+        if size not in by_size:
+            by_size[size] = pygame.transform.scale(image, size)
+        frames.append(by_size[size])
+    return frames
+
+
+def make_effect_rings(colors, radii, width=3):
+    """{color: {radius: ring surface}}: the effect circles, drawn once, centered on their surface."""
+    rings = {}
+    for color in colors:
+        rings[color] = {}
+        for radius in radii:
+            ring = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA)
+            pygame.draw.circle(ring, color, (radius + 1, radius + 1), radius, width=width)
+            rings[color][radius] = ring
+    return rings
+
 class Player(pygame.sprite.Sprite):
     """
     The Player class represents the main character.
@@ -32,14 +68,7 @@ class Player(pygame.sprite.Sprite):
         super().__init__()
         self.animations = {"left": [], "right": []}
         try:
-            for i in range(1, 5):
-                image = pygame.image.load(f"assets/images/player/left_{i}.png").convert_alpha()
-                image = pygame.transform.scale(image, (45, 45))
-                self.animations["left"].append(image)
-            for i in range(1, 5):
-                image = pygame.image.load(f"assets/images/player/right_{i}.png").convert_alpha()
-                image = pygame.transform.scale(image, (45, 45))
-                self.animations["right"].append(image)
+            self.animations = load_animation("assets/images/player", 4, (45, 45))
         except Exception as e:
             print("Error loading player animations:", e)
             placeholder = pygame.Surface((10, 10))
@@ -67,12 +96,19 @@ class Player(pygame.sprite.Sprite):
 
         # New attribute: load shield image from assets.
         try:
-            self.shield_image = pygame.image.load("assets/images/powerups/shield2.png").convert_alpha()
-            # Optionally, scale the image (adjust the size as desired):
-            self.shield_image = pygame.transform.scale(self.shield_image, (self.rect.width + 25, self.rect.height + 25))
+            # Scaled to a little larger than the player (adjust the size as desired):
+            self.shield_image = load_image("assets/images/powerups/shield2.png",
+                                           (self.rect.width + 25, self.rect.height + 25))
         except Exception as e:
             print("Error loading shield image:", e)
             self.shield_image = None
+        # Pulse animations, precomputed so drawing them is one blit per frame.
+        self.shield_frames = []
+        if self.shield_image is not None:
+            self.shield_frames = make_shield_frames(self.shield_image, self.rect.size)
+        self.effect_base_radius = max(self.rect.width, self.rect.height) // 2 + 4
+        self.effect_rings = make_effect_rings(EFFECT_COLORS.values(),
+                                              range(self.effect_base_radius - 2, self.effect_base_radius + 3))
 
         # New attributes for powerups:
         self.shield_timer = 0            # Time remaining for shield
@@ -85,7 +121,7 @@ class Player(pygame.sprite.Sprite):
         self.laser_timer = 0             # Counts time until next laser shot.
         self.laser_bullets = []          # Store automatically fired laser bullets.
 
-    def update(self, dt, keys_pressed, collision_group):
+    def update(self, dt, keys_pressed, level):
         # Update temporary speed boost.
         if self.speed_boost_timer > 0:
             self.speed_boost_timer -= dt
@@ -108,7 +144,7 @@ class Player(pygame.sprite.Sprite):
                 for i in range(num_bullets):
                     angle_deg = i * angle_increment
                     direction = pygame.Vector2(1, 0).rotate(angle_deg)
-                    bullet = Bullet(self.rect.center, direction, self.bullet_speed)
+                    bullet = Bullet.create(self.rect.center, direction, self.bullet_speed)
                     self.shotgun_bullets.append(bullet)
         
         
@@ -128,7 +164,7 @@ class Player(pygame.sprite.Sprite):
         self.intended_pos = self.pos + movement
         self.pos += movement
         self.rect.center = (round(self.pos.x), round(self.pos.y))
-        if pygame.sprite.spritecollideany(self, collision_group):
+        if level.rect_blocked(self.rect):
             self.pos = original_pos
             self.rect.center = (round(self.pos.x), round(self.pos.y))
 
@@ -159,7 +195,7 @@ class Player(pygame.sprite.Sprite):
         direction = direction.normalize()
         spread = 0.0873  # ~5° in radians
         if self.bullet_count == 1:
-            bullet = Bullet(self.rect.center, direction, self.bullet_speed)
+            bullet = Bullet.create(self.rect.center, direction, self.bullet_speed)
             bullets.append(bullet)
         else:
             count = self.bullet_count
@@ -167,7 +203,7 @@ class Player(pygame.sprite.Sprite):
             for i in range(count):
                 angle = start_angle + i * spread
                 rotated = direction.rotate_rad(angle)
-                bullet = Bullet(self.rect.center, rotated, self.bullet_speed)
+                bullet = Bullet.create(self.rect.center, rotated, self.bullet_speed)
                 bullets.append(bullet)
         return bullets
 
@@ -214,37 +250,35 @@ class Player(pygame.sprite.Sprite):
             print("Unknown boost type:", boost_type)
 
     def add_effect(self, effect_type):
-        durations = {"heal": 3.0, "speed": 3.0, "coin": 2.0}
-        colors = {"heal": (0, 255, 0), "speed": (0, 0, 255), "coin": (255, 255, 0)}
-        if effect_type in durations:
+        if effect_type in EFFECT_DURATIONS:
             self.effects.append({
                 "type": effect_type,
-                "remaining": durations[effect_type],
-                "duration": durations[effect_type],
-                "color": colors[effect_type]
+                "remaining": EFFECT_DURATIONS[effect_type],
+                "duration": EFFECT_DURATIONS[effect_type],
+                "color": EFFECT_COLORS[effect_type]
             })
 
-    def draw_effects(self, surface, camera):
-        screen_rect = camera.apply(self)
-        center = screen_rect.center
+    def draw_effects(self, surface, camera, alpha=1.0):
+        # Follow the sprite's interpolated position (see game.timestep).
+        screen_rect = interpolated_rect(self, camera, alpha)
+        center_x, center_y = screen_rect.center
         # Draw the usual pulsating effects.
         for effect in self.effects:
+            # The shield is drawn from its own frames below.
+            if effect["type"] == "shield":
+                continue
+            rings = self.effect_rings.get(effect["color"])
+            if rings is None:
+                continue
             elapsed = effect["duration"] - effect["remaining"]
-            pulsate = 2 * math.sin(2 * math.pi * 3 * elapsed)
-            base_radius = max(self.rect.width, self.rect.height) // 2 + 4
-            radius = base_radius + pulsate
-            # Check if the effect type is not 'shield' before drawing the circle.
-            if effect["type"] != "shield":
-                pygame.draw.circle(surface, effect["color"], center, int(radius), width=3)
-
-        if self.shield_timer > 0 and self.shield_image is not None:
-            elapsed = self.shield_timer
-            pulsate = 1.0 + 0.2 * math.sin(2 * math.pi * elapsed)  # Adjust the 0.1 factor for more/less pulsation
-            shield_width = int(self.rect.width * pulsate) + 20
-            shield_height = int(self.rect.height * pulsate) + 20
-            scaled_shield_image = pygame.transform.scale(self.shield_image, (shield_width, shield_height))
-            shield_rect = scaled_shield_image.get_rect(center=center)
-            surface.blit(scaled_shield_image, shield_rect)
+            radius = int(self.effect_base_radius + 2 * math.sin(2 * math.pi * 3 * elapsed))
+            ring = rings[radius]
+            surface.blit(ring, (center_x - radius - 1, center_y - radius - 1))
+
+        if self.shield_timer > 0 and self.shield_frames:
+            frame = int(self.shield_timer * SHIELD_PULSE_FRAMES) % SHIELD_PULSE_FRAMES
+            shield = self.shield_frames[frame]
+            surface.blit(shield, shield.get_rect(center=(center_x, center_y)))
 
 
 
@@ -1,7 +1,9 @@
 # game/powerup.py
 import pygame
-import random
 from game import settings
+from game.assets import load_font, load_image, overlay_surface, render_text
+from game.menu import is_expose_event, wait_events
+from game.rng import rng
 
 class PowerupCard:
     def __init__(self, boost_type):
@@ -57,8 +59,7 @@ class PowerupCard:
 
         if self.image_path:
             try:
-                self.powerup_image = pygame.image.load(self.image_path).convert_alpha()
-                self.powerup_image = pygame.transform.scale(self.powerup_image, (300, 300))
+                self.powerup_image = load_image(self.image_path, (300, 300))
             except Exception as e:
                 print("Error loading powerup image:", e)
                 self.powerup_image = None
@@ -69,10 +70,10 @@ class PowerupCard:
         card_surface = pygame.Surface((self.width, self.height))
         card_surface.fill(self.color)
         pygame.draw.rect(card_surface, settings.WHITE, card_surface.get_rect(), 4)
-        font_title = pygame.font.Font(None, 32)
-        font_desc = pygame.font.Font(None, 24)
-        font_button = pygame.font.Font(None, 28)
-        name_text = font_title.render(self.name, True, settings.BLACK)
+        font_title = load_font(None, 32)
+        font_desc = load_font(None, 24)
+        font_button = load_font(None, 28)
+        name_text = render_text(font_title, self.name, settings.BLACK)
         card_surface.blit(name_text, (10, 10))
         if self.powerup_image:
             image_rect = self.powerup_image.get_rect()
@@ -86,13 +87,13 @@ class PowerupCard:
         desc_lines = self.description.split('\n')
         y_offset = 360  # Adjusted Y offset
         for line in desc_lines:
-            desc_text = font_desc.render(line, True, settings.BLACK)
+            desc_text = render_text(font_desc, line, settings.BLACK)
             card_surface.blit(desc_text, (10, y_offset))
             y_offset += desc_text.get_height() + 5
         
         pygame.draw.rect(card_surface, settings.GRAY, self.select_button_rect)
         pygame.draw.rect(card_surface, settings.WHITE, self.select_button_rect, 2)
-        button_text = font_button.render("Select", True, settings.WHITE)
+        button_text = render_text(font_button, "Select", settings.WHITE)
         btn_text_rect = button_text.get_rect(center=self.select_button_rect.center)
         card_surface.blit(button_text, btn_text_rect)
         surface.blit(card_surface, self.rect.topleft)
@@ -114,15 +115,19 @@ def get_random_boost(player):
         weights[1] = 0  # Do not offer shotgun if already acquired.
     if getattr(player, "has_laser", False):
         weights[2] = 0
-    chosen_boost = random.choices(options, weights)[0]
+    chosen_boost = rng.choices(options, weights)[0]
     return chosen_boost
 
-def run_powerup_selection(screen, background_surface, enemy_group, player):
-    clock = pygame.time.Clock()
+def offer_boosts(player):
+    """Returns the two different boost types offered at a powerup selection."""
     card1_type = get_random_boost(player)
     card2_type = get_random_boost(player)
     while card2_type == card1_type:
         card2_type = get_random_boost(player)
+    return card1_type, card2_type
+
+def run_powerup_selection(screen, background_surface, enemy_group, player):
+    card1_type, card2_type = offer_boosts(player)
     card1 = PowerupCard(card1_type)
     card2 = PowerupCard(card2_type)
     screen_width, screen_height = screen.get_size()
@@ -131,31 +136,32 @@ def run_powerup_selection(screen, background_surface, enemy_group, player):
 
     for enemy in enemy_group:
         enemy.paused = True
-    
+
+    def draw():
+        screen.blit(background_surface, (0, 0))
+        screen.blit(overlay_surface((0, 0, 0, 180), (screen_width, screen_height)), (0, 0))
+        instruct = render_text(load_font(None, 36), "Choose a Powerup!", settings.WHITE)
+        screen.blit(instruct, (screen_width // 2 - instruct.get_width() // 2, 50))
+        card1.draw(screen)
+        card2.draw(screen)
+        pygame.display.flip()
+
+    # Nothing on this screen animates: draw it once, then sleep until input.
+    draw()
     selected = None
     while selected is None:
-        clock.tick(settings.FPS)
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
+            elif is_expose_event(event):
+                draw()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 pos = event.pos
                 if card1.get_select_button_rect_absolute().collidepoint(pos):
                     selected = card1.boost_type
                 elif card2.get_select_button_rect_absolute().collidepoint(pos):
                     selected = card2.boost_type
-        
-        screen.blit(background_surface, (0, 0))
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
-        font = pygame.font.Font(None, 36)
-        instruct = font.render("Choose a Powerup!", True, settings.WHITE)
-        screen.blit(instruct, (screen_width // 2 - instruct.get_width() // 2, 50))
-        card1.draw(screen)
-        card2.draw(screen)
-        pygame.display.flip()
-        for enemy in enemy_group:
-             enemy.paused = False
+    for enemy in enemy_group:
+        enemy.paused = False
     return selected
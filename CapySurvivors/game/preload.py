@@ -0,0 +1,148 @@
+# game/preload.py
+"""
+Startup preload.
+
+Reading and decoding files (PNG, MP3, level text) needs no display, so it
+runs on a thread pool; pygame releases the GIL while decoding. Only the
+convert/convert_alpha step, which needs the display, runs on the main
+thread, as results come in. Everything ends up in the game.assets and
+game.level caches, so the loaders used later return immediately.
+
+Files that fail to preload are reported and skipped; their loaders try
+again when the game first needs them and fall back to their placeholders.
+"""
+import concurrent.futures
+import time
+
+import pygame
+from game import settings
+from game.assets import add_image, decode_image, is_image_loaded, load_font, load_sound, render_text
+
+
+class Preloader:
+    """
+    Queues file loads on a thread pool:
+      - image(path, size, alpha) and level_background(filename, tile_size)
+        decode on a worker and convert on the main thread in poll(),
+      - sound(path) is decoded entirely on a worker.
+    Call poll() on the main thread until finished, then shutdown().
+    """
+    def __init__(self, workers=None):
+        self.pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers or settings.PRELOAD_WORKERS, thread_name_prefix="preload")
+        # Future -> (name, main-thread finishing step or None).
+        self.pending = {}
+        self.total = 0
+        self.loaded = 0
+        self.failed = []
+
+    def submit(self, name, load, finish=None):
+        self.pending[self.pool.submit(load)] = (name, finish)
+        self.total += 1
+
+    def image(self, path, size=None, alpha=True):
+        if is_image_loaded(path, size, alpha):
+            return
+        self.submit(path, lambda: decode_image(path, size, alpha),
+                    lambda image: add_image(path, image, size, alpha))
+
+    def level_background(self, filename, tile_size):
+        from game.level import BACKGROUND_IMAGE, level_size
+
+        def load():
+            # The background is scaled to the level, so the level file is read first.
+            return decode_image(BACKGROUND_IMAGE, level_size(filename, tile_size), alpha=False)
+
+        self.submit(filename, load,
+                    lambda image: add_image(BACKGROUND_IMAGE, image, image.get_size(), alpha=False))
+
+    def sound(self, path):
+        if pygame.mixer.get_init():
+            self.submit(path, lambda: load_sound(path))
+
+    @property
+    def finished(self):
+        return not self.pending
+
+    @property
+    def progress(self):
+        """Fraction of the queued loads that are done, from 0.0 to 1.0."""
+        return (self.loaded + len(self.failed)) / self.total if self.total else 1.0
+
+    def poll(self, timeout=0.0):
+        """
+        Waits up to timeout seconds for a load to complete, then runs the
+        main-thread step of every completed load.
+        """
+        if not self.pending:
+            return
+        done, _ = concurrent.futures.wait(self.pending, timeout,
+                                          return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            name, finish = self.pending.pop(future)
+            try:
+                result = future.result()
+                if finish:
+                    finish(result)
+                self.loaded += 1
+            except Exception as e:
+                print(f"Error preloading {name}:", e)
+                self.failed.append(name)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+def queue_startup_assets(preloader):
+    """Queues everything the menus, the dialog and the start of a run load."""
+    from game.dialog import CHARACTER_IMAGE, CHARACTER_SIZE
+    from game.menu import GAME_NAME_IMAGE, GAME_NAME_SIZE, MENU_BACKGROUND
+    from game.session import LEVEL_FILES, TILE_SIZE
+    from game.sounds import SOUND_FILES
+
+    preloader.image(MENU_BACKGROUND, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), alpha=False)
+    preloader.image(GAME_NAME_IMAGE, GAME_NAME_SIZE)
+    preloader.image(CHARACTER_IMAGE, CHARACTER_SIZE)
+    for filename in LEVEL_FILES.values():
+        preloader.level_background(filename, TILE_SIZE)
+    for path in SOUND_FILES.values():
+        preloader.sound(path)
+
+
+def draw_progress(screen, progress):
+    screen.fill(settings.BLACK)
+    bar = pygame.Rect(0, 0, settings.SCREEN_WIDTH // 3, 24)
+    bar.center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2 + 30)
+    label = render_text(load_font(None, 48), "Loading...", settings.WHITE)
+    screen.blit(label, label.get_rect(midbottom=(bar.centerx, bar.top - 20)))
+    pygame.draw.rect(screen, settings.GRAY, bar, 2)
+    fill = bar.inflate(-8, -8)
+    fill.width = int(fill.width * progress)
+    pygame.draw.rect(screen, settings.WHITE, fill)
+    pygame.display.flip()
+
+
+def run_preload(screen, workers=None):
+    """
+    Loads the startup assets behind a progress screen, redrawn whenever a
+    load completes (at most settings.FPS times a second).
+    Returns the time it took in seconds.
+    """
+    start = time.perf_counter()
+    preloader = Preloader(workers)
+    queue_startup_assets(preloader)
+    try:
+        draw_progress(screen, 0.0)
+        while not preloader.finished:
+            preloader.poll(1.0 / settings.FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    exit()
+            draw_progress(screen, preloader.progress)
+    finally:
+        preloader.shutdown()
+    elapsed = time.perf_counter() - start
+    if settings.DEBUG:
+        print(f"[debug] preloaded {preloader.loaded}/{preloader.total} assets in {elapsed * 1000:.0f} ms")
+    return elapsed
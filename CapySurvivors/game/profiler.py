@@ -0,0 +1,93 @@
+# game/profiler.py
+import time
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class Profiler:
+    """
+    Named timing scopes for finding out where a tick or frame went:
+
+        with profiler.scope("collision"):
+            ...
+
+    While disabled, scope() hands out one shared no-op context manager,
+    so instrumented code only pays for a method call.
+    Scopes nest freely; by convention a dotted name ("update.enemies") is a
+    part of the scope named before the dot.
+    Totals are kept per scope name until reset(); last holds the most
+    recent duration (in seconds) of every scope, and frame the time spent
+    in every scope since the last end_frame() (a rendered frame may run
+    several simulation ticks).
+    """
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.totals = {}
+        self.calls = {}
+        self.last = {}
+        self.frame = {}
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def record(self, name, seconds):
+        self.last[name] = seconds
+        self.frame[name] = self.frame.get(name, 0.0) + seconds
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+        self.last.clear()
+        self.frame = {}
+
+    def end_frame(self):
+        """Returns {name: seconds} spent in every scope this frame and starts the next one."""
+        finished = self.frame
+        self.frame = {}
+        return finished
+
+    def summary(self):
+        """Returns {name: {"total_ms", "calls", "mean_ms"}} for every recorded scope."""
+        return {
+            name: {
+                "total_ms": total * 1000.0,
+                "calls": self.calls[name],
+                "mean_ms": total * 1000.0 / self.calls[name],
+            }
+            for name, total in self.totals.items()
+        }
+
+
+# Shared instance used by the game loop and the headless runner.
+profiler = Profiler()
@@ -0,0 +1,25 @@
+# game/render.py
+
+
+class RenderQueue:
+    """
+    Draw commands collected per layer and submitted with one Surface.blits
+    call per layer instead of one blit per sprite.
+      - layer(name) returns the layer's list of (surface, dest) pairs to append to.
+      - submit(target, *names) blits the named layers (all, in creation
+        order, if none are given) and empties them.
+    The lists are reused from frame to frame, so a steady scene does not
+    reallocate them.
+    """
+    def __init__(self, *layers):
+        self.layers = {name: [] for name in layers}
+
+    def layer(self, name):
+        return self.layers[name]
+
+    def submit(self, target, *names):
+        for name in names or self.layers:
+            batch = self.layers[name]
+            if batch:
+                target.blits(batch, doreturn=False)
+                batch.clear()
@@ -0,0 +1,170 @@
+# game/replay.py
+"""
+Input recording and replay.
+
+A replay file holds everything a run depends on besides the code: the seed,
+difficulty, simulation rate and screen size, plus the player's input per
+tick (movement keys, mouse position, left clicks and powerup choices) and
+the spawn director's throttle rate, which depends on how fast the machine
+drew the run. Input is stored only when it changes, as gzipped JSON.
+
+Replays are exact on the same code and platform; replaying one with
+python -m game.headless --replay FILE re-simulates the run as fast as
+possible and checks that it ends the same way, so recordings of heavy
+sessions double as performance regression tests.
+"""
+import collections
+import gzip
+import json
+import os
+import time
+
+import pygame
+from game import settings
+
+REPLAY_VERSION = 1
+# The keys the simulation reads; stored per tick as a bit mask.
+REPLAY_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+
+class ReplayDesync(Exception):
+    """Raised when a replay no longer matches the simulation it drives."""
+
+
+def key_mask(keys_pressed):
+    mask = 0
+    for bit, key in enumerate(REPLAY_KEYS):
+        if keys_pressed[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class InputRecorder:
+    """
+    Records the input of one GameSession:
+      - record_tick(keys_pressed, mouse_pos) before every step (which also
+        records changes of the spawn throttle rate),
+      - record_click(pos) for every left click handed to the session,
+      - record_powerup(boost_type) for every powerup choice,
+    then finish(outcome) and save(path) once the run is over.
+    """
+    def __init__(self, session):
+        self.session = session
+        self.header = {
+            "version": REPLAY_VERSION,
+            "seed": session.seed,
+            "difficulty": session.difficulty,
+            "sim_rate": settings.SIM_RATE,
+            "screen": [settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT],
+        }
+        # [tick, key mask, mouse x, mouse y], only when one of them changed.
+        self.inputs = []
+        self.clicks = []
+        self.powerups = []
+        # [tick, spawn rate], whenever the rate changed.
+        self.spawn_rates = []
+        self.result = None
+        self._last_input = None
+        self._last_spawn_rate = 1.0
+
+    def record_tick(self, keys_pressed, mouse_pos):
+        state = (key_mask(keys_pressed), int(mouse_pos[0]), int(mouse_pos[1]))
+        if state != self._last_input:
+            self._last_input = state
+            self.inputs.append([self.session.tick, *state])
+        rate = self.session.spawn_director.rate
+        if rate != self._last_spawn_rate:
+            self._last_spawn_rate = rate
+            self.spawn_rates.append([self.session.tick, rate])
+
+    def record_click(self, pos):
+        self.clicks.append([self.session.tick, int(pos[0]), int(pos[1])])
+
+    def record_powerup(self, boost_type):
+        self.powerups.append([self.session.tick, boost_type])
+
+    def finish(self, outcome=None):
+        """Stores how the run ended; outcome is an OUTCOME_* string, None for an unfinished run."""
+        session = self.session
+        self.result = {
+            "ticks": session.tick,
+            "outcome": outcome or "running",
+            "score": session.score,
+            "kills": session.kills,
+            "player_health": session.player.health,
+        }
+
+    def save(self, path):
+        data = dict(self.header, inputs=self.inputs, clicks=self.clicks,
+                    powerups=self.powerups, spawn_rates=self.spawn_rates, result=self.result)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+class ReplayInput:
+    """
+    Plays a recorded replay back as an input policy and a powerup policy
+    (see game.headless.run_headless).
+    """
+    def __init__(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        self.seed = data["seed"]
+        self.difficulty = data["difficulty"]
+        self.sim_rate = data["sim_rate"]
+        self.screen = tuple(data["screen"])
+        self.result = data["result"]
+        self.inputs = collections.deque(data["inputs"])
+        self.clicks = collections.defaultdict(list)
+        for tick, x, y in data["clicks"]:
+            self.clicks[tick].append((x, y))
+        self.powerups = collections.deque(data["powerups"])
+        # Older replays were all recorded without a throttle.
+        self.spawn_rates = collections.deque(data.get("spawn_rates", ()))
+        self.keys = collections.defaultdict(bool)
+        self.mouse_pos = (self.screen[0] // 2, self.screen[1] // 2)
+
+    @property
+    def ticks(self):
+        """Number of ticks the recorded run lasted (None if it was not finished)."""
+        return self.result["ticks"] if self.result else None
+
+    def __call__(self, session, tick):
+        while self.inputs and self.inputs[0][0] <= tick:
+            _, mask, x, y = self.inputs.popleft()
+            self.keys = collections.defaultdict(bool)
+            for bit, key in enumerate(REPLAY_KEYS):
+                if mask & (1 << bit):
+                    self.keys[key] = True
+            self.mouse_pos = (x, y)
+        while self.spawn_rates and self.spawn_rates[0][0] <= tick:
+            session.spawn_director.set_rate(self.spawn_rates.popleft()[1])
+        return self.keys, self.mouse_pos, self.clicks.pop(tick, ())
+
+    def choose_powerup(self, options, player):
+        if not self.powerups:
+            raise ReplayDesync("the run offered more powerups than were recorded")
+        tick, boost_type = self.powerups.popleft()
+        if boost_type not in options:
+            raise ReplayDesync(f"tick {tick}: recorded powerup {boost_type!r} was not offered {options}")
+        return boost_type
+
+    def check(self, stats):
+        """Returns a list of differences between the recorded result and the replayed stats."""
+        if not self.result:
+            return []
+        return [f"{key}: recorded {value!r}, replayed {stats.get(key)!r}"
+                for key, value in self.result.items() if stats.get(key) != value]
+
+
+def save_replay(recorder, outcome):
+    """Finishes the recording and saves it under settings.REPLAY_DIR; returns the file path."""
+    recorder.finish(outcome)
+    os.makedirs(settings.REPLAY_DIR, exist_ok=True)
+    header = recorder.header
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{header['difficulty']}-{header['seed']}.replay"
+    path = os.path.join(settings.REPLAY_DIR, name)
+    recorder.save(path)
+    return path
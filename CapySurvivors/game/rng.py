@@ -0,0 +1,21 @@
+# game/rng.py
+import random
+
+# Game-owned random number generator. Everything that affects the simulation
+# (spawn rolls and positions, item types, powerup offers, boss summons) draws
+# from it instead of the global random module, so a run is reproducible from
+# its seed. Cosmetic randomness may keep using random.
+rng = random.Random()
+
+
+def new_seed():
+    """A fresh seed for a run that was not given one."""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def reseed(seed=None):
+    """Reseeds the game RNG (with a fresh seed if None) and returns the seed used."""
+    if seed is None:
+        seed = new_seed()
+    rng.seed(seed)
+    return seed
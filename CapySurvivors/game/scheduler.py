@@ -0,0 +1,35 @@
+# game/scheduler.py
+
+
+class SpawnScheduler:
+    """
+    Repeating timers on simulation time, the replacement for
+    pygame.time.set_timer: timed events such as the laser auto-fire happen
+    after the same number of ticks however fast the machine is, and stop
+    while the game is paused (spawns are paced by game.director).
+      - every(event_type, seconds) (re)starts a repeating timer.
+      - advance(dt) moves the clock forward and returns the event types that
+        came due, in the order they came due.
+    """
+    def __init__(self):
+        self.elapsed = 0.0
+        self.intervals = {}
+        self.due = {}
+
+    def every(self, event_type, seconds):
+        self.intervals[event_type] = seconds
+        self.due[event_type] = self.elapsed + seconds
+
+    def clear(self):
+        self.intervals.clear()
+        self.due.clear()
+
+    def advance(self, dt):
+        self.elapsed += dt
+        fired = []
+        for event_type, interval in self.intervals.items():
+            while self.elapsed >= self.due[event_type]:
+                fired.append((self.due[event_type], event_type))
+                self.due[event_type] += interval
+        fired.sort(key=lambda entry: entry[0])
+        return [event_type for _, event_type in fired]
@@ -0,0 +1,450 @@
+# game/session.py
+import pygame
+from game import settings
+from game.assets import overlay_surface
+from game.level import Level
+from game.camera import Camera
+from game.player import Player
+from game.item import Item
+from game.coin import Coin
+from game.ui import UI
+from game.enemy import StandardEnemy, FastEnemy, TankyEnemy, EasyBoss, HardBoss, Summon
+from game.bullet import LaserBullet, cull_projectiles, make_projectile_group
+from game.spatial import SpatialHash
+from game.horde import make_enemy_group
+from game.flowfield import FlowField
+from game.lod import UpdateTiers
+from game.soa import ArrayGroup
+from game.render import RenderQueue
+from game.timestep import queue_interpolated, snapshot
+from game.profiler import profiler
+from game.rng import reseed, rng
+from game.scheduler import SpawnScheduler
+from game.director import SpawnDirector
+
+ENEMY_SPAWN_EVENT = pygame.USEREVENT + 1
+ITEM_SPAWN_EVENT = pygame.USEREVENT + 2
+COIN_SPAWN_EVENT = pygame.USEREVENT + 3
+# Laser auto-fire.
+LASER_SHOOT_EVENT = pygame.USEREVENT + 4
+# Event handled for each spawn of the director (see SpawnDirector).
+SPAWN_EVENTS = {
+    "enemy": ENEMY_SPAWN_EVENT,
+    "item": ITEM_SPAWN_EVENT,
+    "coin": COIN_SPAWN_EVENT,
+}
+
+# Level file per difficulty (anything else plays the easy level).
+LEVEL_FILES = {
+    "easy": "levels/level1.txt",
+    "hard": "levels/level2.txt",
+}
+TILE_SIZE = 50
+
+# Extra pixels around the view when culling sprites for drawing, so sprites
+# interpolated back from just off screen are not dropped.
+CULL_MARGIN = 64
+
+# Outcomes returned by GameSession.step.
+OUTCOME_POWERUP = "powerup"
+OUTCOME_COMPLETE = "complete"
+OUTCOME_GAME_OVER = "game_over"
+
+
+def get_random_floor_position(level, max_attempts=100):
+    for _ in range(max_attempts):
+        x = rng.randint(0, level.width - 1)
+        y = rng.randint(0, level.height - 1)
+        if not level.point_blocked(x, y):
+            return (x, y)
+    return (level.width // 2, level.height // 2)
+
+
+class GameSession:
+    """
+    State and rules of one run: level, player, sprite groups, score and timers.
+      - handle_event(event) reacts to spawn timers and player input.
+      - step(dt, keys_pressed) advances the simulation by one fixed tick and
+        returns an OUTCOME_* string when the caller has to step in. Spawns
+        (see SpawnDirector) and the laser timer (see SpawnScheduler) run on
+        the tick clock; the laser aims at mouse_pos, which the caller keeps
+        up to date.
+      - draw(screen, alpha) renders the world and HUD, interpolating moving
+        sprites between the last two ticks.
+    Menus, dialogs and the display itself are left to the caller (run_game).
+    All randomness comes from game.rng, reseeded with seed (a fresh one if
+    None), so the same seed and the same input per tick replay the same run.
+    """
+    def __init__(self, difficulty, sound_manager, seed=None):
+        self.difficulty = difficulty
+        self.sound_manager = sound_manager
+        self.seed = reseed(seed)
+        self.tick = 0
+        self.scheduler = SpawnScheduler()
+        self.spawn_director = SpawnDirector(difficulty)
+        # Screen-space mouse position, used to aim the laser.
+        self.mouse_pos = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2)
+        self.level = Level(LEVEL_FILES.get(difficulty, LEVEL_FILES["easy"]), tile_size=TILE_SIZE)
+        if self.level.player_start is None:
+            player_spawn = (self.level.width // 2, self.level.height // 2)
+        else:
+            player_spawn = self.level.player_start
+
+        self.player = Player(player_spawn)
+        self.camera = Camera(self.level.width, self.level.height)
+        # Center the camera at the player spawn point:
+        self.camera.camera_rect.topleft = (player_spawn[0] - settings.SCREEN_WIDTH // 2,
+                                           player_spawn[1] - settings.SCREEN_HEIGHT // 2)
+        self.camera.snapshot()
+
+        self.player_group = pygame.sprite.GroupSingle(self.player)
+        # Shared steering toward the player's tile for every enemy.
+        self.flow_field = FlowField(self.level) if settings.USE_FLOW_FIELD else None
+        # Off-screen enemies update less often (level of detail).
+        self.update_tiers = UpdateTiers() if settings.USE_LOD else None
+        self.enemy_group = make_enemy_group(self.player, self.flow_field, self.update_tiers)
+        self.bullet_group = make_projectile_group()
+        self.boss_bullet_group = make_projectile_group()
+        self.item_group = pygame.sprite.Group()
+        self.coin_group = pygame.sprite.Group()
+        # Broad-phase grids for collision queries. Enemies move and are rebuilt
+        # every tick; items and coins are static and kept in sync on spawn/pickup.
+        # Boss bullets only ever hit the player, so they need no grid.
+        self.enemy_grid = SpatialHash(cell_size=128)
+        self.item_grid = SpatialHash(cell_size=128)
+        self.coin_grid = SpatialHash(cell_size=128)
+        self.ui = UI()
+        self.score = 0
+        self.kills = 0
+        self.next_powerup_score = 100
+
+        # Set base enemy speed (spawn pacing is in settings.SPAWN_WAVES).
+        if difficulty == "hard":
+            self.base_enemy_speed = 225
+        else:
+            self.base_enemy_speed = 175
+        self.effective_enemy_speed = self.base_enemy_speed
+
+        self.laser_timer_set = False
+        # Variables for freezer effect.
+        self.freezer_effect_active = False
+        self.freezer_timer = 0.0
+        self.boss = None
+        # Sprites drawn last frame per group (see group_counts for totals).
+        self.visible_counts = {}
+        self.render_queue = RenderQueue("enemies", "player", "projectiles", "pickups")
+
+    def start_timers(self):
+        self.spawn_director.start()
+
+    def stop_timers(self):
+        self.spawn_director.stop()
+        self.scheduler.clear()
+        self.laser_timer_set = False
+
+    def spawned_count(self):
+        """Live enemies, items and coins, the entities the spawn cap counts."""
+        return len(self.enemy_group) + len(self.item_group) + len(self.coin_group)
+
+    def handle_event(self, event):
+        level = self.level
+        player = self.player
+        if event.type == ENEMY_SPAWN_EVENT:
+            level_rect = pygame.Rect(0, 0, level.width, level.height)
+            speed = self.effective_enemy_speed
+            roll = rng.random()
+            if roll < 0.50:
+                enemy = StandardEnemy.spawn(level_rect, player, speed=speed)
+            elif roll < 0.75:
+                enemy = FastEnemy.spawn(level_rect, player, speed=speed + 150)
+            else:
+                enemy = TankyEnemy.spawn(level_rect, player, speed=speed - 100)
+            self.enemy_group.add(enemy)
+        elif event.type == ITEM_SPAWN_EVENT:
+            pos = get_random_floor_position(level)
+            # 10% chance to spawn "freezer"; otherwise "heal" or "speed".
+            r = rng.randint(1, 100)
+            if r <= 10:
+                item_type = "freezer"
+            else:
+                item_type = rng.choice(["heal", "speed"])
+            item = Item(pos, item_type)
+            self.item_group.add(item)
+            self.item_grid.insert(item)
+        elif event.type == COIN_SPAWN_EVENT:
+            pos = get_random_floor_position(level)
+            coin = Coin(pos)
+            self.coin_group.add(coin)
+            self.coin_grid.insert(coin)
+        elif event.type == LASER_SHOOT_EVENT:
+            if player.has_laser:
+                # Use the camera to get the player's current screen position.
+                player_screen_rect = self.camera.apply(player)
+                player_screen_pos = pygame.Vector2(player_screen_rect.center)
+                mouse_pos = pygame.Vector2(self.mouse_pos)
+                direction = mouse_pos - player_screen_pos
+                if direction.length() == 0:
+                    direction = pygame.Vector2(0, -1)
+                else:
+                    direction = direction.normalize()
+                # Offset so that the laser starts at the edge of the player's sprite.
+                offset = direction * (player.rect.width / 2)
+                # Note: player.pos is in world coordinates.
+                start_pos = player.pos + offset
+                self.bullet_group.add(LaserBullet.create(start_pos, direction, player.bullet_speed))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                global_mouse = pygame.Vector2(event.pos) + pygame.Vector2(self.camera.camera_rect.topleft)
+                bullets = player.shoot(global_mouse)
+                if bullets:
+                    for bullet in bullets:
+                        self.bullet_group.add(bullet)
+
+    def _update_freezer(self, dt):
+        if self.freezer_effect_active:
+            self.freezer_timer -= dt
+            if self.freezer_timer <= 0:
+                self.freezer_effect_active = False
+                self.freezer_timer = 0
+                # Restore speeds of affected (non‐boss) enemies.
+                for enemy in self.enemy_group:
+                    if not isinstance(enemy, (EasyBoss, HardBoss)):
+                        if hasattr(enemy, "original_speed"):
+                            enemy.speed = enemy.original_speed
+                self.effective_enemy_speed = self.base_enemy_speed
+            else:
+                self.effective_enemy_speed = self.base_enemy_speed - 75
+                for enemy in self.enemy_group:
+                    if not isinstance(enemy, (EasyBoss, HardBoss)):
+                        if not hasattr(enemy, "original_speed"):
+                            enemy.original_speed = enemy.speed
+                        enemy.speed = enemy.original_speed - 75
+        else:
+            self.effective_enemy_speed = self.base_enemy_speed
+
+    def _award_kill(self, enemy):
+        self.kills += 1
+        if isinstance(enemy, EasyBoss):
+            self.score += 100
+            self.sound_manager.play_sound("boss_kill")
+        elif isinstance(enemy, HardBoss):
+            self.score += 200
+            self.sound_manager.play_sound("boss_kill")
+        elif isinstance(enemy, Summon):
+            self.score += 5
+            self.sound_manager.play_sound("enemy_kill")
+        else:
+            self.score += 10
+            self.sound_manager.play_sound("enemy_kill")
+
+    def step(self, dt, keys_pressed):
+        player = self.player
+        level = self.level
+        sound_manager = self.sound_manager
+        snapshot(self.player_group, self.enemy_group, self.bullet_group, self.boss_bullet_group)
+        self.camera.snapshot()
+        self.tick += 1
+
+        for kind in self.spawn_director.advance(dt, self.spawned_count()):
+            self.handle_event(pygame.event.Event(SPAWN_EVENTS[kind]))
+        for event_type in self.scheduler.advance(dt):
+            self.handle_event(pygame.event.Event(event_type))
+
+        self._update_freezer(dt)
+
+        # Set laser timer event if the player has the laser powerup.
+        if player.has_laser and not self.laser_timer_set:
+            self.scheduler.every(LASER_SHOOT_EVENT, 4.0)  # every 4 seconds
+            self.laser_timer_set = True
+
+        # Spawn boss when score threshold reached.
+        if self.score >= 750 and self.boss is None:
+            boss_pos = StandardEnemy._spawn_position(pygame.Rect(0, 0, level.width, level.height))
+            if self.difficulty == "hard":
+                self.boss = HardBoss(boss_pos, player, self.boss_bullet_group, self.enemy_group, sound_manager)
+            else:
+                self.boss = EasyBoss(boss_pos, player, self.boss_bullet_group)
+            self.enemy_group.add(self.boss)
+
+        with profiler.scope("update"):
+            with profiler.scope("update.player"):
+                self.player_group.update(dt, keys_pressed, level)
+            with profiler.scope("update.enemies"):
+                if self.flow_field is not None:
+                    self.flow_field.update(player.rect.center)
+                if self.update_tiers is not None:
+                    self.update_tiers.update(self.camera.camera_rect)
+                self.enemy_group.update(dt)
+            with profiler.scope("update.bullets"):
+                self.bullet_group.update(dt)
+                self.boss_bullet_group.update(dt)
+            self.item_group.update(dt)
+            self.coin_group.update(dt)
+
+        with profiler.scope("collision"):
+            self._collide()
+
+        # Only end the game when the score is 1500+ AND the boss is dead.
+        boss_alive = self.boss is not None and self.boss.alive()
+        if self.score >= 1500 and not boss_alive:
+            return OUTCOME_COMPLETE
+
+        self.camera.update(player)
+
+        # Add any auto-shotgun and laser bullets from the player.
+        if player.has_shotgun and player.shotgun_bullets:
+            for bullet in player.shotgun_bullets:
+                self.bullet_group.add(bullet)
+            player.shotgun_bullets.clear()
+
+        if player.has_laser and player.laser_bullets:
+            for laser in player.laser_bullets:
+                self.bullet_group.add(laser)
+            player.laser_bullets.clear()
+
+        if self.score >= self.next_powerup_score:
+            self.next_powerup_score += 100
+            return OUTCOME_POWERUP
+        if player.health <= 0:
+            return OUTCOME_GAME_OVER
+        return None
+
+    def _collide(self):
+        player = self.player
+        sound_manager = self.sound_manager
+
+        # Drop projectiles that hit walls or left the level.
+        cull_projectiles(self.bullet_group, self.level)
+        cull_projectiles(self.boss_bullet_group, self.level)
+
+        self.enemy_grid.build(self.enemy_group)
+        for bullet in self.bullet_group:
+            hit_enemies = self.enemy_grid.collide(bullet)
+            if hit_enemies:
+                for enemy in hit_enemies:
+                    if getattr(bullet, "is_laser", False):
+                        # For laser bullets, damage each enemy only once.
+                        if id(enemy) not in bullet.damaged_enemies:
+                            if enemy.take_damage(1):
+                                self._award_kill(enemy)
+                            bullet.damaged_enemies.add(id(enemy))
+                    else:
+                        if enemy.take_damage(1):
+                            self._award_kill(enemy)
+                        bullet.kill()
+
+        for bullet in pygame.sprite.spritecollide(player, self.boss_bullet_group, False):
+            player.take_damage(10)
+            sound_manager.play_sound("enemy_collision")
+            bullet.kill()
+
+        hit_enemies = self.enemy_grid.collide(player)
+        for enemy in hit_enemies:
+            if isinstance(enemy, (EasyBoss, HardBoss)):
+                player.health = 0
+                sound_manager.play_sound("enemy_collision")
+            else:
+                player.take_damage(10)
+                sound_manager.play_sound("enemy_collision")
+                enemy.kill()
+
+        hit_items = self.item_grid.collide(player, dokill=True)
+        for item in hit_items:
+            if item.item_type == "heal":
+                player.health = player.max_hp
+                sound_manager.play_sound("heal")
+                player.add_effect("heal")
+            elif item.item_type == "speed":
+                player.apply_speed_boost(10, 100)
+                player.add_effect("speed")
+                sound_manager.play_sound("speed")
+            elif item.item_type == "freezer":
+                if not self.freezer_effect_active:
+                    self.freezer_effect_active = True
+                    self.freezer_timer = 7.0
+                    sound_manager.play_sound("freezer")
+                    player.add_effect("freezer")
+
+        hit_coins = self.coin_grid.collide(player, dokill=True)
+        for coin in hit_coins:
+            self.score += 10
+            player.add_effect("coin")
+            sound_manager.play_sound("coin")
+
+    def draw_world(self, screen, alpha=1.0):
+        """Draws the level and every sprite, interpolated at fraction alpha of the current tick."""
+        view = self.camera.interpolated(alpha)
+        screen.fill(settings.BLACK)
+        with profiler.scope("draw.level"):
+            self.level.draw(screen, view)
+        with profiler.scope("draw.entities"):
+            self._draw_entities(screen, view, alpha)
+
+    def _visible(self, group, grid, view_rect):
+        """
+        Sprites of group that may be on screen. Enemies, items and coins come
+        from their collision grid; bullets have none and are culled in bulk
+        on their position arrays.
+        """
+        if grid is not None:
+            return grid.query(view_rect)
+        if isinstance(group, ArrayGroup):
+            return group.sprites_in(view_rect)
+        return [sprite for sprite in group if view_rect.colliderect(sprite.rect)]
+
+    def _draw_entities(self, screen, view, alpha):
+        view_rect = view.camera_rect.inflate(2 * CULL_MARGIN, 2 * CULL_MARGIN)
+        visible_enemies = self._visible(self.enemy_group, self.enemy_grid, view_rect)
+        visible_bullets = self._visible(self.bullet_group, None, view_rect)
+        visible_boss_bullets = self._visible(self.boss_bullet_group, None, view_rect)
+        visible_items = self._visible(self.item_group, self.item_grid, view_rect)
+        visible_coins = self._visible(self.coin_group, self.coin_grid, view_rect)
+        self.visible_counts = {
+            "enemies": len(visible_enemies),
+            "bullets": len(visible_bullets),
+            "boss_bullets": len(visible_boss_bullets),
+            "items": len(visible_items),
+            "coins": len(visible_coins),
+        }
+
+        queue = self.render_queue
+        queue_interpolated(queue.layer("enemies"), self.enemy_group, view, alpha, visible_enemies)
+        queue.submit(screen, "enemies")
+        if self.boss is not None and self.boss.alive():
+            self.boss.draw_hp_bar(screen, view, alpha)
+
+        # If freezer effect is active, draw a translucent light blue overlay over the screen.
+        if self.freezer_effect_active:
+            screen.blit(overlay_surface((173, 216, 230, 100)), (0, 0))  # light blue tint with alpha 100
+
+        # Draw the player last so it is not tinted.
+        queue_interpolated(queue.layer("player"), self.player_group, view, alpha)
+        queue.submit(screen, "player")
+        self.player.draw_effects(screen, view, alpha)
+
+        projectiles = queue.layer("projectiles")
+        queue_interpolated(projectiles, self.bullet_group, view, alpha, visible_bullets)
+        queue_interpolated(projectiles, self.boss_bullet_group, view, alpha, visible_boss_bullets)
+        # Items and coins do not move: place them with the camera offset only.
+        offset_x, offset_y = view.camera_rect.topleft
+        pickups = queue.layer("pickups")
+        for sprite in visible_items + visible_coins:
+            rect = sprite.rect
+            pickups.append((sprite.image, (rect.x - offset_x, rect.y - offset_y)))
+        queue.submit(screen, "projectiles", "pickups")
+
+    def draw(self, screen, alpha=1.0):
+        with profiler.scope("draw"):
+            self.draw_world(screen, alpha)
+            with profiler.scope("draw.ui"):
+                self.ui.draw_status(screen, self.player, self.score)
+
+    def group_counts(self):
+        """Live sprite counts per group, for debug output."""
+        return {
+            "enemies": len(self.enemy_group),
+            "bullets": len(self.bullet_group),
+            "boss_bullets": len(self.boss_bullet_group),
+            "items": len(self.item_group),
+            "coins": len(self.coin_group),
+        }
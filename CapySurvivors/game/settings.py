@@ -5,8 +5,21 @@ import pygame
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 
-# Frames per second
+# Frames per second (render cap)
 FPS = 60
+# Menus sleep in pygame.event.wait for at most this long (ms) instead of
+# redrawing at FPS while nothing happens.
+MENU_WAIT_TIMEOUT = 500
+# Worker threads decoding images and sounds at startup (see game.preload).
+PRELOAD_WORKERS = 4
+# Keep decoded, scaled images in ASSET_CACHE_DIR (see game.asset_cache).
+ASSET_CACHE = True
+ASSET_CACHE_DIR = ".cache/assets"
+
+# Fixed simulation rate (ticks per second), independent of the render rate.
+SIM_RATE = 120
+# Most simulation ticks run per rendered frame before the game slows down instead.
+MAX_SIM_STEPS = 8
 
 # Colors (RGB)
 WHITE = (255, 255, 255)
@@ -17,9 +30,78 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 DARK_GRAY = (80, 80, 80)
 
+# Move regular enemies with the vectorized NumPy horde engine (if NumPy is installed).
+USE_HORDE_ENGINE = True
+# Enemies path around walls and obstacles (game.flowfield) instead of
+# walking straight at the player through them.
+USE_FLOW_FIELD = True
+# Crowd separation for horde enemies: neighbours closer than SEPARATION_RADIUS
+# pixels push each other apart with SEPARATION_STRENGTH (0 turns it off).
+# At most SEPARATION_MAX_PER_CELL enemies per radius-sized grid cell are
+# considered, which bounds the cost in dense crowds.
+SEPARATION_RADIUS = 48
+SEPARATION_STRENGTH = 3.0
+SEPARATION_MAX_PER_CELL = 6
+# Simulation ticks between separation updates (the push is reused in between).
+SEPARATION_INTERVAL = 3
+# Level of detail for enemy updates (game.lod): enemies within
+# LOD_VISIBLE_MARGIN pixels of the view update every tick, those within
+# LOD_NEAR_MARGIN every LOD_INTERVALS[1] ticks, the rest every LOD_INTERVALS[2].
+USE_LOD = True
+LOD_VISIBLE_MARGIN = 128
+LOD_NEAR_MARGIN = 640
+LOD_INTERVALS = (1, 2, 8)
+
+# Spawn pacing per difficulty (see game.director): for each kind, the
+# seconds between spawns over the run as (seconds into the run, interval)
+# points, linear in between and flat after the last point.
+SPAWN_WAVES = {
+    "easy": {"enemy": ((0, 0.89),), "item": ((0, 12.0),), "coin": ((0, 7.0),)},
+    "hard": {"enemy": ((0, 0.79),), "item": ((0, 15.0),), "coin": ((0, 7.0),)},
+}
+# No enemies, items or coins spawn while this many are alive.
+SPAWN_ENTITY_CAP = 1500
+# Slow enemy spawns down when simulating and drawing a frame takes more than
+# SPAWN_THROTTLE_HIGH of the frame budget (1 / FPS), averaged over
+# SPAWN_THROTTLE_WINDOW seconds: one SPAWN_THROTTLE_STEP less of the wave
+# curve's pace per window, down to SPAWN_THROTTLE_MIN_RATE, and back up
+# while under SPAWN_THROTTLE_LOW.
+SPAWN_THROTTLE = False
+SPAWN_THROTTLE_HIGH = 0.9
+SPAWN_THROTTLE_LOW = 0.7
+SPAWN_THROTTLE_WINDOW = 1.0
+SPAWN_THROTTLE_STEP = 0.1
+SPAWN_THROTTLE_MIN_RATE = 0.3
+
+# Print periodic debug statistics (drawn and live sprites per group) to the console.
+DEBUG = False
+DEBUG_INTERVAL = 1.0  # seconds between debug reports
+# Key that toggles the in-game profiler overlay (frame-time graph, per-phase timings, group counts).
+PROFILER_KEY = pygame.K_F3
+
+# Record the input of every run to REPLAY_DIR; replay one with
+# python -m game.headless --replay FILE.
+RECORD_REPLAYS = False
+REPLAY_DIR = "replays"
+
 # Default sound volume (0.0 to 1.0)
 DEFAULT_VOLUME = 0.5
 
+# Mixer channels reserved per sound category (see game.sounds.SoundManager);
+# a category never plays more voices at once than its pool holds.
+SOUND_CHANNELS = {
+    "kills": 4,
+    "combat": 3,
+    "pickups": 2,
+    "events": 2,
+}
+# Unreserved channels left for anything else.
+SOUND_FREE_CHANNELS = 4
+# The same sound effect is started at most once per this many milliseconds.
+SOUND_DEDUP_MS = 16
+# Keep decoded sound samples in ASSET_CACHE_DIR as well.
+AUDIO_CACHE = True
+
 # Game states
 STATE_MAIN_MENU = "main_menu"
 STATE_GAME = "game"
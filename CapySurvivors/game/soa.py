@@ -0,0 +1,197 @@
+# game/soa.py
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Array-backed groups are optional; sprites fall back to per-sprite updates.
+    np = None
+
+
+class ArrayField:
+    """
+    Sprite attribute that lives in the owning ArrayGroup's arrays while the
+    sprite is attached to one, and in the instance __dict__ otherwise.
+      - choices: store a string attribute as an index into this tuple.
+    Vector attributes (pos, direction) are handed out as pygame.Vector2
+    copies, so in-place updates like `sprite.pos += v` still write back.
+    Classes using it need `array_group = None` and `slot = -1` defaults.
+    """
+    def __init__(self, choices=None):
+        self.choices = choices
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        group = obj.array_group
+        if group is None:
+            return obj.__dict__[self.name]
+        value = group.arrays[self.name][obj.slot]
+        if value.ndim:
+            return pygame.Vector2(value[0], value[1])
+        value = value.item()
+        if self.choices is not None:
+            return self.choices[value]
+        return value
+
+    def __set__(self, obj, value):
+        group = obj.array_group
+        if group is None:
+            obj.__dict__[self.name] = value
+            return
+        if self.choices is not None:
+            value = self.choices.index(value)
+        group.arrays[self.name][obj.slot] = value
+
+
+class ArrayGroup(pygame.sprite.Group):
+    """
+    Sprite group that keeps per-sprite state in structure-of-arrays storage.
+      - FIELDS maps attribute names to (dtype, trailing shape); accepted
+        sprites get a slot and their ArrayField attributes move into arrays.
+      - Extra (internal) fields not backed by a sprite attribute are listed
+        in INTERNAL_FIELDS and initialised by attach().
+      - Every group also keeps "prev_pos", the position at the previous
+        snapshot(), and "half_size", half of each sprite's rect size, for
+        rendering (see screen_positions()).
+      - Slots are kept dense: removing a sprite moves the last one into its hole.
+      - Sprites that are not accepted are kept in self.unmanaged and updated
+        one by one.
+    Subclasses override step(dt) with the vectorized update; FIELDS must contain "pos".
+    """
+    FIELDS = {}
+    INTERNAL_FIELDS = ()
+
+    def __init__(self, capacity=256):
+        super().__init__()
+        self.members = []  # Managed sprites, index == slot.
+        self.unmanaged = []
+        self.capacity = capacity
+        # Largest half width/height of any sprite attached so far, for sprites_in().
+        self.extent = 0
+        fields = dict(self.FIELDS, prev_pos=self.FIELDS["pos"], half_size=("int64", (2,)))
+        self.arrays = {name: np.zeros((capacity,) + shape, dtype=dtype)
+                       for name, (dtype, shape) in fields.items()}
+
+    def accepts(self, sprite):
+        return False
+
+    def attach(self, sprite, slot):
+        """Hook for subclasses to fill INTERNAL_FIELDS for a newly attached sprite."""
+
+    def _sprite_state(self, sprite):
+        return {name: getattr(sprite, name) for name in self.FIELDS if name not in self.INTERNAL_FIELDS}
+
+    def snapshot(self):
+        """Remembers the current positions as the previous tick's, for interpolation."""
+        count = len(self.members)
+        self.arrays["prev_pos"][:count] = self.arrays["pos"][:count]
+        for sprite in self.unmanaged:
+            sprite.prev_center = sprite.rect.center
+
+    def screen_positions(self, alpha, offset, slots=None):
+        """
+        Per managed sprite (or per slot in slots), the [x, y] to blit it at:
+        its rect's top-left at fraction alpha between the previous snapshot
+        and now, minus the camera offset. Computed for all sprites at once.
+        """
+        count = len(self.members)
+        pos = self.arrays["pos"][:count]
+        prev = self.arrays["prev_pos"][:count]
+        half_size = self.arrays["half_size"][:count]
+        if slots is not None:
+            pos = pos[slots]
+            prev = prev[slots]
+            half_size = half_size[slots]
+        topleft = np.rint(prev + (pos - prev) * alpha) - half_size - offset
+        return topleft.astype(np.int64).tolist()
+
+    def sprites_in(self, rect):
+        """
+        Bulk broad-phase for culling: the managed sprites whose position lies
+        within self.extent of rect, in slot order, plus the unmanaged sprites
+        whose rect collides with it.
+        """
+        count = len(self.members)
+        pos = self.arrays["pos"][:count]
+        extent = self.extent
+        x = pos[:, 0]
+        y = pos[:, 1]
+        inside = ((x >= rect.left - extent) & (x <= rect.right + extent)
+                  & (y >= rect.top - extent) & (y <= rect.bottom + extent))
+        members = self.members
+        found = [members[slot] for slot in np.flatnonzero(inside).tolist()]
+        found.extend(sprite for sprite in self.unmanaged if rect.colliderect(sprite.rect))
+        return found
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, array in self.arrays.items():
+            grown = np.zeros((self.capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:len(self.members)] = array[:len(self.members)]
+            self.arrays[name] = grown
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if not self.accepts(sprite):
+            self.unmanaged.append(sprite)
+            return
+        if sprite.array_group is not None:
+            return
+        if len(self.members) == self.capacity:
+            self._grow()
+        # Move the sprite's state into the arrays, then switch it over.
+        state = self._sprite_state(sprite)
+        slot = len(self.members)
+        self.members.append(sprite)
+        self.extent = max(self.extent, (max(sprite.rect.size) + 1) // 2)
+        sprite.array_group = self
+        sprite.slot = slot
+        for name, value in state.items():
+            setattr(sprite, name, value)
+        self.arrays["prev_pos"][slot] = self.arrays["pos"][slot]
+        self.arrays["half_size"][slot] = (sprite.rect.width // 2, sprite.rect.height // 2)
+        self.attach(sprite, slot)
+
+    def remove_internal(self, sprite):
+        if sprite.array_group is self:
+            # Copy the state back to the sprite, then fill the hole with the last slot.
+            state = self._sprite_state(sprite)
+            slot = sprite.slot
+            last = len(self.members) - 1
+            if slot != last:
+                moved = self.members[last]
+                for array in self.arrays.values():
+                    array[slot] = array[last]
+                self.members[slot] = moved
+                moved.slot = slot
+            self.members.pop()
+            sprite.array_group = None
+            sprite.slot = -1
+            for name, value in state.items():
+                setattr(sprite, name, value)
+        elif sprite in self.unmanaged:
+            self.unmanaged.remove(sprite)
+        super().remove_internal(sprite)
+
+    def update(self, dt):
+        self.step(dt)
+        for sprite in list(self.unmanaged):
+            sprite.update(dt)
+
+    def step(self, dt):
+        """Vectorized update of the managed sprites; does nothing unless a subclass overrides it."""
+
+    def sync_rects(self, count, slots=None):
+        """Writes the "pos" array back to the managed sprites' rect centers (only those in slots, if given)."""
+        if slots is None:
+            centers = np.rint(self.arrays["pos"][:count]).astype(np.int64).tolist()
+            for sprite, center in zip(self.members, centers):
+                sprite.rect.center = center
+            return
+        members = self.members
+        centers = np.rint(self.arrays["pos"][slots]).astype(np.int64).tolist()
+        for slot, center in zip(slots.tolist(), centers):
+            members[slot].rect.center = center
@@ -1,8 +1,41 @@
 # game/sounds.py
 import pygame
 import os
+from game import settings
+from game.assets import load_sound
+
+BACKGROUND_MUSIC = os.path.join("assets", "sounds", "background.mp3")
+# Sound effects by key, for SoundManager and the startup preload.
+SOUND_FILES = {
+    key: os.path.join("assets", "sounds", f"{key}.mp3")
+    for key in ("coin", "heal", "speed", "freezer", "enemy_collision",
+                "enemy_kill", "boss_kill", "player_hit", "hardboss_shoot")
+}
+# Channel pool (see settings.SOUND_CHANNELS) each sound effect plays on.
+SOUND_CATEGORIES = {
+    "coin": "pickups",
+    "heal": "pickups",
+    "speed": "pickups",
+    "freezer": "pickups",
+    "enemy_collision": "combat",
+    "player_hit": "combat",
+    "hardboss_shoot": "combat",
+    "enemy_kill": "kills",
+    "boss_kill": "events",
+}
 
 class SoundManager:
+    """
+    Background music and sound effects.
+      - Effects are decoded on first use (game.assets.load_sound), so a
+        SoundManager that never plays anything, e.g. at volume 0 in headless
+        runs, never decodes anything.
+      - Each category of effects plays on its own pool of reserved mixer
+        channels; when a pool is full, the voice that started first is cut
+        off and reused, so a burst of kills cannot use more voices than that.
+      - The same effect is started at most once per settings.SOUND_DEDUP_MS
+        (about a frame); repeats within that window are dropped.
+    """
     def __init__(self, volume=0.5):
         self.volume = volume
 
@@ -11,26 +44,25 @@ class SoundManager:
 
         # Load background music.
         # Ensure the file exists in the assets/sounds folder.
-        self.background_music = os.path.join("assets", "sounds", "background.mp3")
-        
-        # Dictionary to hold various sound effects.
+        self.background_music = BACKGROUND_MUSIC
+
+        # Sound effects decoded so far, by key; None for files that failed to load.
         self.sounds = {}
-        try:
-            self.sounds["coin"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "coin.mp3"))
-            self.sounds["heal"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "heal.mp3"))
-            self.sounds["speed"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "speed.mp3"))
-            self.sounds["freezer"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "freezer.mp3"))
-            self.sounds["enemy_collision"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "enemy_collision.mp3"))
-            self.sounds["enemy_kill"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "enemy_kill.mp3"))
-            self.sounds["boss_kill"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "boss_kill.mp3"))
-            self.sounds["player_hit"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "player_hit.mp3"))
-            self.sounds["hardboss_shoot"] = pygame.mixer.Sound(os.path.join("assets", "sounds", "hardboss_shoot.mp3"))
-        except Exception as e:
-            print("Error loading sound effect:", e)
+        # Per category, [channel, start time] for each reserved channel.
+        self.pools = {}
+        self.last_played = {}
+        self.stats = {"played": 0, "deduplicated": 0, "stolen": 0}
+        self.reserve_channels()
 
-        # Set volume for each sound effect.
-        for key, sound in self.sounds.items():
-            sound.set_volume(self.volume)
+    def reserve_channels(self):
+        """Reserves the first channels of the mixer for the category pools."""
+        reserved = sum(settings.SOUND_CHANNELS.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + settings.SOUND_FREE_CHANNELS))
+        pygame.mixer.set_reserved(reserved)
+        index = 0
+        for category, count in settings.SOUND_CHANNELS.items():
+            self.pools[category] = [[pygame.mixer.Channel(index + i), 0] for i in range(count)]
+            index += count
 
     def play_background_music(self):
         """Plays background music on an infinite loop."""
@@ -41,9 +73,45 @@ class SoundManager:
         except Exception as e:
             print("Error playing background music:", e)
 
+    def get_sound(self, key):
+        """Returns the decoded effect for key (decoding it on first use), or None."""
+        if key in self.sounds:
+            return self.sounds[key]
+        sound = None
+        if key not in SOUND_FILES:
+            print(f"Sound '{key}' not found.")
+        else:
+            try:
+                sound = load_sound(SOUND_FILES[key])
+                sound.set_volume(self.volume)
+            except Exception as e:
+                print("Error loading sound effect:", e)
+                sound = None
+        self.sounds[key] = sound
+        return sound
+
     def play_sound(self, key):
         """Plays the sound effect corresponding to the given key (e.g., 'coin', 'heal')."""
-        if key in self.sounds:
-            self.sounds[key].play()
+        if self.volume <= 0:
+            return
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(key)
+        if last is not None and now - last < settings.SOUND_DEDUP_MS:
+            self.stats["deduplicated"] += 1
+            return
+        sound = self.get_sound(key)
+        if sound is None:
+            return
+        self.last_played[key] = now
+        pool = self.pools.get(SOUND_CATEGORIES.get(key))
+        if not pool:
+            sound.play()
         else:
-            print(f"Sound '{key}' not found.")
+            # A free channel if there is one, else steal the oldest voice.
+            voice = next((voice for voice in pool if not voice[0].get_busy()), None)
+            if voice is None:
+                voice = min(pool, key=lambda voice: voice[1])
+                self.stats["stolen"] += 1
+            voice[0].play(sound)
+            voice[1] = now
+        self.stats["played"] += 1
@@ -0,0 +1,92 @@
+# game/spatial.py
+
+class SpatialHash:
+    """
+    Uniform grid broad-phase for rect collision between sprites.
+      - Each sprite is bucketed into every cell its rect overlaps.
+      - Queries only test the sprites in the cells the query rect overlaps,
+        so collision cost grows with local density instead of group size.
+    Moving groups (enemies, bullets) are rebuilt once per tick with build();
+    static groups (items, coins) are kept up to date with insert()/remove().
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, sprite):
+        cells = self.cells
+        x0, x1, y0, y1 = self._cell_range(sprite.rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def remove(self, sprite):
+        """Removes a sprite; its rect must not have moved since it was inserted."""
+        x0, x1, y0, y1 = self._cell_range(sprite.rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket and sprite in bucket:
+                    bucket.remove(sprite)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def build(self, *groups):
+        """Clears the grid and inserts every sprite of the given groups."""
+        self.cells.clear()
+        for group in groups:
+            for sprite in group:
+                self.insert(sprite)
+
+    def query(self, rect):
+        """
+        Returns the live sprites whose rect collides with rect.
+        Sprites killed since the last build() are skipped.
+        """
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self.cells
+        colliderect = rect.colliderect
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            return [sprite for sprite in bucket if colliderect(sprite.rect) and sprite.alive()]
+
+        found = []
+        seen = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for sprite in bucket:
+                    if sprite in seen:
+                        continue
+                    seen.add(sprite)
+                    if colliderect(sprite.rect) and sprite.alive():
+                        found.append(sprite)
+        return found
+
+    def collide(self, sprite, dokill=False):
+        """
+        Grid equivalent of pygame.sprite.spritecollide(sprite, group, dokill).
+        With dokill, hit sprites are killed and removed from the grid.
+        """
+        hits = self.query(sprite.rect)
+        if dokill:
+            for hit in hits:
+                self.remove(hit)
+                hit.kill()
+        return hits
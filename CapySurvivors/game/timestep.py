@@ -0,0 +1,94 @@
+# game/timestep.py
+from game.soa import ArrayGroup
+
+
+class FixedTimestep:
+    """
+    Accumulator that runs the simulation at a fixed rate, independent of the frame rate.
+      - advance(frame_dt) returns how many fixed steps of step_dt to run this frame.
+      - alpha is the fraction of a step left over, used to interpolate rendering
+        between the previous and the current simulation state.
+    At most max_steps are run per frame; time beyond that is dropped, so one
+    long stall cannot snowball into an ever-growing catch-up.
+    """
+    def __init__(self, rate, max_steps=8):
+        self.step_dt = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        self.accumulator += frame_dt
+        steps = int(self.accumulator // self.step_dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_dt
+        return steps
+
+    def reset(self):
+        """Forgets accumulated time (e.g. after a blocking menu)."""
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.step_dt, 1.0)
+
+
+def snapshot(*groups):
+    """Stores the current position of every sprite as its previous-tick position."""
+    for group in groups:
+        if isinstance(group, ArrayGroup):
+            group.snapshot()
+        else:
+            for sprite in group:
+                sprite.prev_center = sprite.rect.center
+
+
+def queue_interpolated(batch, group, camera, alpha, visible=None):
+    """
+    Appends an (image, dest) pair to batch for every sprite of group, placed
+    at fraction alpha between its previous-tick position and its current
+    one; sprites without a snapshot are placed where they are. Submit the
+    batch with Surface.blits.
+      - visible: only queue these sprites of the group (e.g. the result of a
+        broad-phase query against the view). Array-backed sprites are queued
+        in slot order, the rest in the order given.
+    """
+    offset_x, offset_y = offset = camera.camera_rect.topleft
+    if isinstance(group, ArrayGroup):
+        if visible is None:
+            members = group.members
+            positions = group.screen_positions(alpha, offset)
+            sprites = group.unmanaged
+        else:
+            members = sorted((sprite for sprite in visible if sprite.array_group is group),
+                             key=lambda sprite: sprite.slot)
+            positions = group.screen_positions(alpha, offset, [sprite.slot for sprite in members])
+            visible = set(visible)
+            sprites = [sprite for sprite in group.unmanaged if sprite in visible]
+        batch.extend(zip([sprite.image for sprite in members], positions))
+    else:
+        sprites = group if visible is None else visible
+    for sprite in sprites:
+        dx, dy = _interpolation_offset(sprite, alpha)
+        rect = sprite.rect
+        batch.append((sprite.image, (rect.x + dx - offset_x, rect.y + dy - offset_y)))
+
+
+def _interpolation_offset(sprite, alpha):
+    """Interpolated center minus current center of a plain sprite: (current - prev) * (alpha - 1)."""
+    prev = sprite.__dict__.get("prev_center")
+    if prev is None:
+        return 0, 0
+    rect = sprite.rect
+    return round((rect.centerx - prev[0]) * (alpha - 1)), round((rect.centery - prev[1]) * (alpha - 1))
+
+
+def interpolated_rect(sprite, camera, alpha):
+    """
+    Screen rect of a plain sprite where queue_interpolated draws it, for
+    things drawn around the sprite (effects, health bars).
+    """
+    dx, dy = _interpolation_offset(sprite, alpha)
+    return camera.apply(sprite).move(dx, dy)
@@ -1,36 +1,53 @@
 # game/ui.py
 import pygame
 from game import settings
+from game.assets import load_font, render_text
 
 class UI:
     def __init__(self):
-        self.font = pygame.font.Font(None, 36)
-        self.large_font = pygame.font.Font(None, 72)
-    
+        self.font = load_font(None, 36)
+        self.large_font = load_font(None, 72)
+        # The HUD texts packed into one surface, plus one (surface, dest, area)
+        # blit per text; rebuilt only when a shown value changes.
+        self.hud_key = None
+        self.hud_surface = None
+        self.hud_blits = []
+
+    def _build_hud(self, player, score):
+        texts = [
+            # Health and score on the top-left.
+            ("Health: " + str(player.health), {"topleft": (10, 10)}),
+            ("Score: " + str(score), {"topleft": (10, 50)}),
+            # Movement speed and bullet speed on the bottom-right.
+            ("Movement Speed: " + str(player.speed),
+             {"bottomright": (settings.SCREEN_WIDTH - 10, settings.SCREEN_HEIGHT - 40)}),
+            ("Bullet Speed: " + str(player.bullet_speed),
+             {"bottomright": (settings.SCREEN_WIDTH - 10, settings.SCREEN_HEIGHT - 10)}),
+            # The goal on the top-right.
+            ("Goal: 1500", {"topright": (settings.SCREEN_WIDTH - 10, 10)}),
+        ]
+        renders = [(render_text(self.font, text, settings.BLACK), anchor) for text, anchor in texts]
+        width = max(render.get_width() for render, _ in renders)
+        height = sum(render.get_height() for render, _ in renders)
+        self.hud_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.hud_blits = []
+        y = 0
+        for render, anchor in renders:
+            # Copy (not blend) the text into the transparent atlas.
+            area = self.hud_surface.blit(render, (0, y), special_flags=pygame.BLEND_RGBA_MAX)
+            dest = render.get_rect(**anchor)
+            self.hud_blits.append((self.hud_surface, dest.topleft, area))
+            y += area.height
+
     def draw_status(self, surface, player, score):
-        # Draw health and score on the top-left.
-        health_text = self.font.render("Health: " + str(player.health), True, settings.BLACK)
-        score_text = self.font.render("Score: " + str(score), True, settings.BLACK)
-        surface.blit(health_text, (10, 10))
-        surface.blit(score_text, (10, 50))
-        
-        # Draw player's movement speed and bullet speed on the bottom-right.
-        speed_text = "Movement Speed: " + str(player.speed)
-        bullet_text = "Bullet Speed: " + str(player.bullet_speed)
-        speed_render = self.font.render(speed_text, True, settings.BLACK)
-        bullet_render = self.font.render(bullet_text, True, settings.BLACK)
-        speed_rect = speed_render.get_rect(bottomright=(settings.SCREEN_WIDTH - 10, settings.SCREEN_HEIGHT - 40))
-        bullet_rect = bullet_render.get_rect(bottomright=(settings.SCREEN_WIDTH - 10, settings.SCREEN_HEIGHT - 10))
-        surface.blit(speed_render, speed_rect)
-        surface.blit(bullet_render, bullet_rect)
-        
-        # Draw the goal at the top–right.
-        goal_text = "Goal: 1500"
-        goal_render = self.font.render(goal_text, True, settings.BLACK)
-        goal_rect = goal_render.get_rect(topright=(settings.SCREEN_WIDTH - 10, 10))
-        surface.blit(goal_render, goal_rect)
-    
+        key = (player.health, score, player.speed, player.bullet_speed,
+               settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        if key != self.hud_key:
+            self.hud_key = key
+            self._build_hud(player, score)
+        surface.blits(self.hud_blits, doreturn=False)
+
     def draw_message(self, surface, text, color=settings.RED):
-        message = self.large_font.render(text, True, color)
+        message = render_text(self.large_font, text, color)
         rect = message.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
         surface.blit(message, rect)